@@ -2,6 +2,12 @@
 #include <dht11.h>
 #include <ArduinoJson.h>
 
+// On-board anomaly pre-screening, generated by Python/edgeExport.py
+#if __has_include("edgeModel.h")
+#include "edgeModel.h"
+#define EDGE_MODEL_AVAILABLE
+#endif
+
 
 // Left side motors (2 motors in parallel) via L298N Channel A
 int motor1pin1 = 2;  // IN1 - Left motors backward
@@ -30,11 +36,31 @@ dht11 DHT11;
 // Distance threshold for obstacle avoidance
 int distanceThreshold = 20;
 
-// DHT11 sensor reading frequency(every 5 seconds)
-const long DHT11_FREQUENCY = 5000;
+// DHT11 sensor reading frequency (default every 5 seconds)
+// adjusted by the host with the "rateNNN" command
+unsigned long sensorFrequency = 5000;
+
+// Allowed range for the reporting interval (ms)
+// DHT11 needs at least 1 second between reads
+const unsigned long MIN_SENSOR_FREQUENCY = 1000;
+const unsigned long MAX_SENSOR_FREQUENCY = 60000;
+
+// last time sensor data was sent, from any path
+unsigned long lastSensorSend = 0;
+
+// Minimum gap between two DHT11 reads (ms), shared by every path that needs a reading
+const unsigned long DHT11_MIN_READ_INTERVAL = 1000;
 
-// last reading from the DHT11 sensor
-unsigned long lastDHT11Read = 0;
+// last time the DHT11 was actually read, and whether it has been read yet
+unsigned long lastDHT11Sample = 0;
+bool dht11Sampled = false;
+
+// On-board anomaly check frequency
+const unsigned long EDGE_CHECK_FREQUENCY = 1000;
+
+// last on-board anomaly check, and whether the last check was anomalous
+unsigned long lastEdgeCheck = 0;
+bool edgeAnomaly = false;
 
 // Robot mode selection: remote or autonomous
 // Default mode: "remote"
@@ -113,6 +139,32 @@ void loop() {
       }
 
 
+      // Telemetry rate control: command starts with "rate"
+      // and followed by the interval in ms, e.g. "rate1000"
+      if (command.startsWith("rate")) {
+
+          // Extracting number after "rate"
+          long newRate = command.substring(4).toInt();
+
+          // Checking if the interval is on the correct range
+          if (newRate >= (long)MIN_SENSOR_FREQUENCY && newRate <= (long)MAX_SENSOR_FREQUENCY) {
+
+              sensorFrequency = newRate;
+
+              Serial.print("Rate set to: ");
+              Serial.println(sensorFrequency);
+          }
+
+          // Incorrect value for rate
+          else {
+
+              Serial.println("Invalid rate! Must be between 1000 and 60000.");
+          }
+
+          return;
+      }
+
+
       // Mode switching logic
       if (command == "m") {
           
@@ -140,21 +192,26 @@ void loop() {
           autonomousMode();
       }
 
-    // Sending sensor data via Bluetooth every 5 seconds
-    if (currentMillis - lastDHT11Read >= DHT11_FREQUENCY) {
-        
-        lastDHT11Read = currentMillis;
-        
-        sendSensorData();
+    // Sending sensor data via Bluetooth every sensorFrequency ms, in every mode
+    sendSensorDataLimited();
+
+#ifdef EDGE_MODEL_AVAILABLE
+    // Pre-screening readings on board, without waiting for the host
+    if (currentMillis - lastEdgeCheck >= EDGE_CHECK_FREQUENCY) {
+
+        lastEdgeCheck = currentMillis;
+
+        edgeCheck();
     }
+#endif
 }
 
 
 // Function to control robot remotely
 void controlRobot(String command) {
 
-    // Sending the data
-    sendSensorData();
+    // Sending the data, rate-limited
+    sendSensorDataLimited();
     
     Serial.print("Command received: ");
     Serial.println(command);
@@ -196,9 +253,6 @@ void controlRobot(String command) {
 // Function to control the robot autonomously
 void autonomousMode() {
 
-    // Sending the data
-    sendSensorData();
-    
     // Taking the distance between the robot and the obstacle
     int distance = measureDistance();
     
@@ -234,7 +288,7 @@ void sendSensorData() {
     
     StaticJsonDocument<200> doc;
 
-    int dhtData = DHT11.read(DHT11_PIN);
+    readDHT11();
     
     // Taking temperature data
     float tempValue = (float)DHT11.temperature;
@@ -255,6 +309,65 @@ void sendSensorData() {
 
     // Sending JSON via Bluetooth
     Serial.println(jsonString);
+
+    lastSensorSend = millis();
+}
+
+
+#ifdef EDGE_MODEL_AVAILABLE
+// Function to flag anomalies locally: stop the car and send a priority alert
+void edgeCheck() {
+
+    readDHT11();
+
+    // Readings in tenths, the fixed-point scale of the exported model
+    int16_t tempValue = DHT11.temperature * EDGE_MODEL_SCALE;
+    int16_t humValue = DHT11.humidity * EDGE_MODEL_SCALE;
+    int16_t gasValue = readGasSensor() * EDGE_MODEL_SCALE;
+
+    bool anomaly = edgeModelPredict(tempValue, humValue, gasValue) == 1;
+
+    // Acting only when an anomaly starts, the host does the full scoring
+    if (anomaly && !edgeAnomaly) {
+
+        stopMotors();
+
+        // Leaving autonomous mode, so the car does not drive on
+        mode = "remote";
+
+        Serial.println("Edge anomaly detected!");
+
+        // Priority send, bypassing the rate limits
+        sendSensorData();
+    }
+
+    edgeAnomaly = anomaly;
+}
+#endif
+
+
+// Function to send sensor data at most every sensorFrequency ms, whichever path asks
+// Only the edge anomaly alert bypasses it
+void sendSensorDataLimited() {
+
+    if (millis() - lastSensorSend >= sensorFrequency) {
+
+        sendSensorData();
+    }
+}
+
+
+// Function to refresh the DHT11 reading, at most every DHT11_MIN_READ_INTERVAL
+// In between, DHT11.temperature and DHT11.humidity keep the last reading
+void readDHT11() {
+
+    if (!dht11Sampled || millis() - lastDHT11Sample >= DHT11_MIN_READ_INTERVAL) {
+
+        DHT11.read(DHT11_PIN);
+
+        lastDHT11Sample = millis();
+        dht11Sampled = true;
+    }
 }
 
 
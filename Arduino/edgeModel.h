@@ -0,0 +1,36 @@
+// Generated by edgeExport.py from randomForest_Model.joblib on 2026-10-19, do not edit
+// Distilled anomaly tree, scaler folded in, thresholds in tenths of a unit
+#ifndef EDGE_MODEL_H
+#define EDGE_MODEL_H
+
+#include <avr/pgmspace.h>
+
+#define EDGE_MODEL_SCALE 10
+#define EDGE_MODEL_NODES 23
+
+const int8_t edgeFeature[] PROGMEM = {0, 1, 2, 0, -1, 2, -1, -1, -1, -1, 2, 1, -1, 2, -1, 1, -1, -1, 2, 1, -1, -1, -1};
+const int16_t edgeThreshold[] PROGMEM = {354, 344, 5035, 315, 0, 2079, 0, 1, 1, 0, 2184, 344, 1, 2075, 0, 465, 1, 0, 2224, 465, 1, 0, 1};
+const uint8_t edgeLeft[] PROGMEM = {1, 2, 3, 4, 0, 6, 0, 0, 0, 0, 11, 12, 0, 14, 0, 16, 0, 0, 19, 20, 0, 0, 0};
+const uint8_t edgeRight[] PROGMEM = {10, 9, 8, 5, 0, 7, 0, 0, 0, 0, 18, 13, 0, 15, 0, 17, 0, 0, 22, 21, 0, 0, 0};
+
+// Returns 1 if the reading looks anomalous (smoke/fire possible), 0 otherwise
+// Inputs are temperature, humidity and gas multiplied by EDGE_MODEL_SCALE
+static inline uint8_t edgeModelPredict(int16_t temperature, int16_t humidity, int16_t gas) {
+
+  int16_t x[3] = {temperature, humidity, gas};
+
+  uint8_t node = 0;
+  int8_t feature = (int8_t)pgm_read_byte(&edgeFeature[node]);
+
+  while (feature >= 0) {
+
+    int16_t threshold = (int16_t)pgm_read_word(&edgeThreshold[node]);
+
+    node = (x[feature] <= threshold) ? pgm_read_byte(&edgeLeft[node]) : pgm_read_byte(&edgeRight[node]);
+    feature = (int8_t)pgm_read_byte(&edgeFeature[node]);
+  }
+
+  return (uint8_t)pgm_read_word(&edgeThreshold[node]);
+}
+
+#endif
@@ -8,13 +8,16 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, confusion_matrix, ConfusionMatrixDisplay
 from xgboost import XGBClassifier
+from telemetryCompression import load_reconstructed
 
 
 # Ignoring warnings
 warnings.filterwarnings('ignore')
 
 # Loading dataset
-dataset = pd.read_csv('sensorData.csv')
+# The CSV is compressed (mostly anomalies and changes), so it is resampled
+# back to the 2 s reading interval to keep the original class balance
+dataset = load_reconstructed('sensorData.csv')
 
 # Removing spaces
 dataset.columns = dataset.columns.str.strip()
@@ -0,0 +1,362 @@
+# Importing the required libraries
+import os
+import json
+import time
+import heapq
+import queue
+import random
+import requests
+from threading import Thread, Lock, Condition
+
+
+# Asynchronous anomaly alerts: verdicts are queued by the serial loop,
+# grouped into incidents, persisted locally and delivered to webhooks
+class AlertDispatcher:
+
+    def __init__(self, targets, incidentFile='incidents.jsonl', queueDir='alert_queue',
+                 quietSeconds=30.0, maxQueued=500, workers=2, timeout=3.0,
+                 maxRetries=8, baseDelay=1.0, maxDelay=300.0):
+
+        self.targets = list(targets)
+
+        self.incidentFile = incidentFile
+        self.queueDir = queueDir
+
+        # An incident closes after this many seconds without anomalies
+        self.quietSeconds = quietSeconds
+
+        # Bounded on-disk queue: the oldest deliveries are dropped first
+        self.maxQueued = maxQueued
+
+        self.workerCount = workers
+        self.timeout = timeout
+
+        # Exponential backoff: baseDelay * 2^attempt, capped at maxDelay
+        self.maxRetries = maxRetries
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+
+        # Verdicts from the hot path, never blocking the producer
+        self.verdicts = queue.Queue(maxsize=10000)
+        self.droppedVerdicts = 0
+
+        self.incident = None
+
+        # Pending deliveries: heap of (due time, file path)
+        self.pending = []
+        self.pendingCondition = Condition()
+
+        self.fileLock = Lock()
+
+        self.stats = {"incidents": 0, "delivered": 0, "retried": 0, "failed": 0, "dropped": 0}
+
+        self.running = False
+
+
+    # Starting the aggregator and delivery workers, resuming any queued deliveries
+    def start(self):
+
+        os.makedirs(self.queueDir, exist_ok=True)
+
+        for fileName in sorted(os.listdir(self.queueDir)):
+
+            if fileName.endswith('.json'):
+
+                self._schedule(time.time(), os.path.join(self.queueDir, fileName))
+
+        self.running = True
+
+        Thread(target=self._aggregate, name='alert-aggregator', daemon=True).start()
+
+        for index in range(self.workerCount):
+
+            Thread(target=self._deliver, name=f'alert-worker-{index}', daemon=True).start()
+
+        return self
+
+
+    # Called from the serial loop: O(1), never blocks
+    def submit(self, anomaly, reading, timeStamp=None):
+
+        try:
+
+            self.verdicts.put_nowait((timeStamp or time.time(), int(anomaly), dict(reading)))
+
+        except queue.Full:
+
+            self.droppedVerdicts += 1
+
+
+    # Aggregator thread: debouncing verdicts into incidents
+    def _aggregate(self):
+
+        while self.running:
+
+            try:
+
+                timeStamp, anomaly, reading = self.verdicts.get(timeout=1.0)
+
+            except queue.Empty:
+
+                timeStamp, anomaly, reading = None, 0, None
+
+            if anomaly:
+
+                self._record_anomaly(timeStamp, reading)
+
+            # Closing the incident after a quiet period
+            if self.incident is not None and time.time() - self.incident["last_seen"] >= self.quietSeconds:
+
+                self._close_incident()
+
+
+    def _record_anomaly(self, timeStamp, reading):
+
+        if self.incident is None:
+
+            self.stats["incidents"] += 1
+
+            self.incident = {
+
+                "id": f"{int(timeStamp * 1000)}",
+                "start": timeStamp,
+                "end": None,
+                "last_seen": timeStamp,
+                "count": 1,
+                "peak": dict(reading)
+            }
+
+            self._publish("incident_opened")
+
+            return
+
+        self.incident["last_seen"] = timeStamp
+        self.incident["count"] += 1
+
+        for key, value in reading.items():
+
+            if isinstance(value, (int, float)):
+
+                self.incident["peak"][key] = max(self.incident["peak"].get(key, value), value)
+
+
+    def _close_incident(self):
+
+        self.incident["end"] = self.incident["last_seen"]
+
+        self._publish("incident_closed")
+
+        self.incident = None
+
+
+    # Persisting the incident state and queueing one delivery per target
+    def _publish(self, event):
+
+        payload = dict(self.incident, event=event)
+
+        with self.fileLock:
+
+            with open(self.incidentFile, 'a') as file:
+
+                file.write(json.dumps(payload) + "\n")
+
+        for target in self.targets:
+
+            self._enqueue(target, payload)
+
+
+    def _enqueue(self, target, payload):
+
+        # Dropping the oldest deliveries when the queue is full
+        with self.pendingCondition:
+
+            queued = sorted(f for f in os.listdir(self.queueDir) if f.endswith('.json'))
+
+            for fileName in queued[:max(0, len(queued) - self.maxQueued + 1)]:
+
+                self._remove(os.path.join(self.queueDir, fileName))
+
+                self.stats["dropped"] += 1
+
+            path = os.path.join(self.queueDir, f"{time.time_ns()}_{random.randrange(1 << 16):05d}.json")
+
+            self._write(path, {"target": target, "payload": payload, "attempts": 0})
+
+        self._schedule(time.time(), path)
+
+
+    def _schedule(self, due, path):
+
+        with self.pendingCondition:
+
+            heapq.heappush(self.pending, (due, path))
+
+            self.pendingCondition.notify()
+
+
+    # Taking the next due delivery, waiting until one is due
+    def _next_due(self):
+
+        with self.pendingCondition:
+
+            while self.running:
+
+                if self.pending:
+
+                    due, path = self.pending[0]
+
+                    wait = due - time.time()
+
+                    if wait <= 0:
+
+                        heapq.heappop(self.pending)
+
+                        return path
+
+                else:
+
+                    wait = None
+
+                self.pendingCondition.wait(wait)
+
+        return None
+
+
+    # Delivery worker: POST with timeout, exponential backoff on failure
+    def _deliver(self):
+
+        while self.running:
+
+            path = self._next_due()
+
+            # Dropped from the queue while waiting
+            if path is None or not os.path.exists(path):
+
+                continue
+
+            try:
+
+                with open(path) as file:
+
+                    delivery = json.load(file)
+
+            except (OSError, ValueError):
+
+                continue
+
+            try:
+
+                response = requests.post(delivery["target"], json=delivery["payload"], timeout=self.timeout)
+
+                delivered = 200 <= response.status_code < 300
+
+            except requests.RequestException:
+
+                delivered = False
+
+            if delivered:
+
+                self.stats["delivered"] += 1
+
+                self._remove(path)
+
+                continue
+
+            delivery["attempts"] += 1
+
+            if delivery["attempts"] > self.maxRetries:
+
+                print(f"Alert delivery to {delivery['target']} failed after {self.maxRetries} retries")
+
+                self.stats["failed"] += 1
+
+                self._remove(path)
+
+                continue
+
+            self.stats["retried"] += 1
+
+            delay = min(self.maxDelay, self.baseDelay * 2 ** (delivery["attempts"] - 1))
+
+            # Under the queue lock, so a delivery dropped as the oldest is not recreated
+            with self.pendingCondition:
+
+                if not os.path.exists(path):
+
+                    continue
+
+                self._write(path, delivery)
+
+            self._schedule(time.time() + delay * random.uniform(0.5, 1.0), path)
+
+
+    def _write(self, path, delivery):
+
+        temporary = path + '.tmp'
+
+        with open(temporary, 'w') as file:
+
+            json.dump(delivery, file)
+
+        os.replace(temporary, path)
+
+
+    def _remove(self, path):
+
+        try:
+
+            os.remove(path)
+
+        except FileNotFoundError:
+
+            pass
+
+
+    def stop(self):
+
+        self.running = False
+
+        with self.pendingCondition:
+
+            self.pendingCondition.notify_all()
+
+
+# Local HTTP stand-in receiver, for testing the dispatcher without a real webhook
+# Use port=0 for a free port (server.server_port)
+def run_test_receiver(port=8099, failFirst=0):
+
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    received = []
+
+    class Receiver(BaseHTTPRequestHandler):
+
+        def do_POST(self):
+
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+            # Simulating an unhealthy receiver for the first requests
+            if len(received) < failFirst:
+
+                received.append(None)
+
+                self.send_response(503)
+
+            else:
+
+                received.append(json.loads(body))
+
+                self.send_response(200)
+
+            self.end_headers()
+
+        def log_message(self, *args):
+
+            pass
+
+    server = HTTPServer(('127.0.0.1', port), Receiver)
+
+    Thread(target=server.serve_forever, name='alert-receiver', daemon=True).start()
+
+    return server, received
+
@@ -0,0 +1,16 @@
+# Importing the required libraries
+import numpy as np
+
+
+# Function to turn a model's predictions into anomaly labels (1 = anomaly)
+# Classifiers predict 1 for anomalies; Isolation Forest style models have no
+# classes and predict -1, so the convention comes from the model, not the batch
+def anomaly_labels(model, predictions):
+
+    predictions = np.asarray(predictions)
+
+    if not hasattr(model, 'classes_'):
+
+        return (predictions == -1).astype(int)
+
+    return (predictions == 1).astype(int)
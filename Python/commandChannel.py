@@ -0,0 +1,106 @@
+# Importing the required libraries
+import time
+from threading import Lock
+
+
+# Command kinds, matched against the firmware's ack lines
+MOVE = "move"
+SPEED = "speed"
+RATE = "rate"
+MODE = "mode"
+
+
+# Function to get the kind and value of a command, e.g. "speed150" -> ("speed", "150")
+def command_kind(command):
+
+    for prefix in (SPEED, RATE):
+
+        if command.startswith(prefix):
+
+            return prefix, command[len(prefix):]
+
+    if command == "m":
+
+        return MODE, None
+
+    return MOVE, command
+
+
+# Host-to-car command channel, shared by the keyboard and the rate controller
+class CommandChannel:
+
+    def __init__(self, serialCon):
+
+        self.serialCon = serialCon
+
+        # Serializing writes from several threads on the same serial port
+        self.writeLock = Lock()
+
+        # Last command sent and when it was sent
+        self.lastCommand = None
+        self.lastSentAt = None
+
+        # Commands waiting for their ack, per kind: (value, sent time)
+        self.pending = {}
+
+        # Last acked value and round-trip time per kind
+        self.acked = {}
+
+        # Last command refused by the firmware per kind, with its reason
+        self.rejected = {}
+
+
+    # Sending a command to Arduino Uno via Bluetooth
+    def send(self, command):
+
+        kind, value = command_kind(command)
+
+        with self.writeLock:
+
+            self.serialCon.write((command + "\n").encode())
+
+            self.lastCommand = command
+            self.lastSentAt = time.time()
+
+            self.pending[kind] = (value, self.lastSentAt)
+
+        print(f"Sent command: {command}")
+
+
+    # Called by the serial parser for ack lines ("Speed set to: 150", ...)
+    def acknowledge(self, kind, value):
+
+        now = time.time()
+
+        with self.writeLock:
+
+            sent = self.pending.pop(kind, None)
+
+            roundTrip = now - sent[1] if sent is not None else None
+
+            self.acked[kind] = {"value": value, "at": now, "round_trip": roundTrip}
+
+
+    # Called by the serial parser for "Invalid ...!" replies, the command is no longer pending
+    def reject(self, kind, reason):
+
+        now = time.time()
+
+        with self.writeLock:
+
+            sent = self.pending.pop(kind, None)
+
+            # Move commands are acked before they are validated, so the value may come from the ack
+            value = sent[0] if sent is not None else self.acked.get(kind, {}).get("value")
+
+            self.rejected[kind] = {"value": value, "at": now, "reason": reason}
+
+
+    # Commands sent but not acked yet, with their age in seconds
+    def unacknowledged(self):
+
+        now = time.time()
+
+        with self.writeLock:
+
+            return {kind: {"value": value, "age": now - sentAt} for kind, (value, sentAt) in self.pending.items()}
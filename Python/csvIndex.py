@@ -0,0 +1,239 @@
+# Importing the required libraries
+import os
+import bisect
+from threading import Lock
+from datetime import datetime, timedelta
+
+
+# Timestamps are written as '%Y-%m-%d %H:%M:%S', which sorts as plain text
+TIMESTAMP_LENGTH = 19
+
+
+# Sparse time index for sensorData.csv: (timestamp, byte offset) of one row
+# every `everyRows` rows or `everySeconds` seconds, kept in a sidecar file
+class CsvTimeIndex:
+
+    def __init__(self, csvFile, everyRows=500, everySeconds=600):
+
+        self.csvFile = csvFile
+        self.indexFile = csvFile + '.idx'
+
+        self.everyRows = everyRows
+        self.everySeconds = everySeconds
+
+        self.lock = Lock()
+
+        self.timeStamps = []
+        self.offsets = []
+
+        self.loaded = False
+
+        # Rows since the last entry, and the timestamp at which the next entry is due
+        self.rowsSinceEntry = 0
+        self.nextEntryAt = None
+
+
+    # Loading the sidecar, rebuilding it if it is missing or does not match the CSV
+    def load(self):
+
+        with self.lock:
+
+            if self.loaded:
+
+                return
+
+            if not self._read_sidecar() or not self._matches_csv():
+
+                self._rebuild()
+
+            self.loaded = True
+
+
+    def _read_sidecar(self):
+
+        self.timeStamps, self.offsets = [], []
+
+        try:
+
+            with open(self.indexFile) as file:
+
+                for line in file:
+
+                    timeStamp, offset = line.rstrip('\n').rsplit(',', 1)
+
+                    self.timeStamps.append(timeStamp)
+                    self.offsets.append(int(offset))
+
+        except (OSError, ValueError):
+
+            return False
+
+        return True
+
+
+    # Checking that the last entry still points at a row with its timestamp
+    def _matches_csv(self):
+
+        if not os.path.exists(self.csvFile):
+
+            return not self.offsets
+
+        if not self.offsets:
+
+            return os.path.getsize(self.csvFile) == 0
+
+        with open(self.csvFile, 'rb') as file:
+
+            file.seek(self.offsets[-1])
+
+            return file.read(TIMESTAMP_LENGTH).decode('utf-8', 'replace') == self.timeStamps[-1]
+
+
+    # Rebuilding the index in a single pass over the CSV
+    def _rebuild(self):
+
+        self.timeStamps, self.offsets = [], []
+
+        self.rowsSinceEntry = 0
+        self.nextEntryAt = None
+
+        if os.path.exists(self.csvFile):
+
+            with open(self.csvFile, 'rb') as file:
+
+                # Skipping the header
+                offset = len(file.readline())
+
+                for line in file:
+
+                    self._maybe_add(line[:TIMESTAMP_LENGTH].decode('utf-8', 'replace'), offset)
+
+                    offset += len(line)
+
+        with open(self.indexFile, 'w') as file:
+
+            file.writelines(f"{timeStamp},{offset}\n" for timeStamp, offset in zip(self.timeStamps, self.offsets))
+
+
+    # Adding an entry when enough rows or time passed, returns True if added
+    def _maybe_add(self, timeStamp, offset):
+
+        # Comparing text timestamps, so rows between entries are never parsed
+        due = (not self.offsets
+               or self.rowsSinceEntry >= self.everyRows
+               or (self.nextEntryAt is not None and timeStamp >= self.nextEntryAt))
+
+        self.rowsSinceEntry += 1
+
+        if not due:
+
+            return False
+
+        self.timeStamps.append(timeStamp)
+        self.offsets.append(offset)
+
+        self.rowsSinceEntry = 1
+        self.nextEntryAt = _add_seconds(timeStamp, self.everySeconds)
+
+        return True
+
+
+    # Called by the CSV writer for every data row it appends
+    def note(self, timeStamp, offset):
+
+        self.load()
+
+        with self.lock:
+
+            if self._maybe_add(timeStamp, offset):
+
+                with open(self.indexFile, 'a') as file:
+
+                    file.write(f"{timeStamp},{offset}\n")
+
+
+    # Forgetting all entries, when the CSV is recreated
+    def reset(self):
+
+        with self.lock:
+
+            self.timeStamps, self.offsets = [], []
+
+            self.rowsSinceEntry = 0
+            self.nextEntryAt = None
+
+            self.loaded = True
+
+            if os.path.exists(self.indexFile):
+
+                os.remove(self.indexFile)
+
+
+    # Streaming the header and the rows with start <= timestamp <= end
+    # Either bound may be None; bounds use the CSV timestamp format
+    def iter_range(self, start=None, end=None, chunkSize=64 * 1024):
+
+        self.load()
+
+        with self.lock:
+
+            # Starting from an entry strictly before `start`: rows of the same second
+            # may have been written before an entry stamped with it
+            position = bisect.bisect_left(self.timeStamps, start) - 1 if start is not None else 0
+
+            offset = self.offsets[max(position, 0)] if self.offsets else None
+
+        with open(self.csvFile, 'rb') as file:
+
+            buffer = [file.readline()]
+            size = len(buffer[0])
+
+            if offset is None:
+
+                yield b''.join(buffer)
+
+                return
+
+            file.seek(offset)
+
+            for line in file:
+
+                # A row still being appended
+                if not line.endswith(b'\n'):
+
+                    break
+
+                timeStamp = line[:TIMESTAMP_LENGTH].decode('utf-8', 'replace')
+
+                if start is not None and timeStamp < start:
+
+                    continue
+
+                if end is not None and timeStamp > end:
+
+                    break
+
+                buffer.append(line)
+                size += len(line)
+
+                if size >= chunkSize:
+
+                    yield b''.join(buffer)
+
+                    buffer, size = [], 0
+
+            if buffer:
+
+                yield b''.join(buffer)
+
+
+# Function to shift a CSV timestamp by some seconds (None if malformed)
+def _add_seconds(timeStamp, seconds):
+
+    try:
+
+        return (datetime.strptime(timeStamp, '%Y-%m-%d %H:%M:%S') + timedelta(seconds=seconds)).strftime('%Y-%m-%d %H:%M:%S')
+
+    except ValueError:
+
+        return None
@@ -0,0 +1,313 @@
+# Importing the required libraries
+import os
+import sys
+import argparse
+import warnings
+import numpy as np
+import pandas as pd
+from joblib import load
+from datetime import datetime
+from sklearn.tree import DecisionTreeClassifier
+from anomalyLabels import anomaly_labels
+
+
+# Feature order shared with the firmware
+FEATURES = ['Temperature', 'Humidity', 'Gas']
+
+# Fixed-point scale: features and thresholds are int16 in tenths of a unit
+FIXED_SCALE = 10
+
+# Bytes per node in flash: feature (int8), threshold (int16), left and right (uint8)
+NODE_BYTES = 5
+
+# Node indices are uint8
+MAX_NODES = 255
+
+# Trained artifacts per model name
+ARTIFACTS = {
+
+    "randomForest": ('randomForest_Model.joblib', 'randomForest_Scaler.joblib'),
+    "XGBoost": ('XGBoost_Model.joblib', 'XGBoost_Scaler.joblib')
+}
+
+
+# Function to load and clean the dataset like the training scripts
+def load_dataset(csvFile):
+
+    dataset = pd.read_csv(csvFile)
+
+    # Removing spaces
+    dataset.columns = dataset.columns.str.strip()
+
+    dataset.fillna(dataset.select_dtypes(include='number').mean(), inplace=True)
+
+    return dataset
+
+
+# Function to get the teacher's anomaly labels (1 = anomaly)
+def teacher_labels(model, scaler, X):
+
+    return anomaly_labels(model, model.predict(scaler.transform(X)))
+
+
+# Function to build the distillation set: the real readings plus jittered
+# and uniform samples over the sensor ranges, all labeled by the teacher
+def distillation_set(model, scaler, X, samples=20000, seed=42):
+
+    generator = np.random.default_rng(seed)
+
+    low, high = X.min(axis=0), X.max(axis=0)
+
+    jittered = X[generator.integers(0, len(X), samples)] + generator.normal(0, 1, (samples, X.shape[1])) * X.std(axis=0) * 0.1
+
+    uniform = generator.uniform(low, high, (samples, X.shape[1]))
+
+    # DHT11 and analogRead values are integers on the car
+    augmented = np.round(np.vstack([X, jittered, uniform]))
+
+    return augmented, teacher_labels(model, scaler, augmented)
+
+
+# Function to distill the teacher into the largest tree that fits the flash budget
+# The student is trained on scaled features, like the teacher
+def distill(model, scaler, X, flashBudget, maxDepth, seed=42):
+
+    distilledX, distilledY = distillation_set(model, scaler, X, seed=seed)
+
+    scaledX = scaler.transform(distilledX)
+
+    for depth in range(maxDepth, 0, -1):
+
+        student = DecisionTreeClassifier(max_depth=depth, min_samples_leaf=5, random_state=seed)
+
+        student.fit(scaledX, distilledY)
+
+        nodes = student.tree_.node_count
+
+        if nodes <= MAX_NODES and nodes * NODE_BYTES <= flashBudget:
+
+            return student
+
+    raise ValueError(f"No tree fits in {flashBudget} bytes")
+
+
+# Function to fold the scaler into the tree and convert it to fixed point
+# A split "scaled <= t" becomes "raw <= t * scale + mean", and for raw values
+# in tenths "raw10 <= floor((t * scale + mean) * 10)" decides the same way
+def export_tree(student, scaler):
+
+    tree = student.tree_
+
+    exported = {"feature": [], "threshold": [], "left": [], "right": []}
+
+    for node in range(tree.node_count):
+
+        # Leaf: feature -1, threshold holds the class (1 = anomaly)
+        if tree.children_left[node] == -1:
+
+            exported["feature"].append(-1)
+            exported["threshold"].append(int(student.classes_[np.argmax(tree.value[node][0])]))
+            exported["left"].append(0)
+            exported["right"].append(0)
+
+            continue
+
+        feature = int(tree.feature[node])
+
+        rawThreshold = tree.threshold[node] * scaler.scale_[feature] + scaler.mean_[feature]
+
+        fixedThreshold = int(np.clip(np.floor(rawThreshold * FIXED_SCALE), -32768, 32767))
+
+        exported["feature"].append(feature)
+        exported["threshold"].append(fixedThreshold)
+        exported["left"].append(int(tree.children_left[node]))
+        exported["right"].append(int(tree.children_right[node]))
+
+    return collapse(exported)
+
+
+# Function to prune splits whose subtrees all give the same class, renumbering nodes
+def collapse(exported):
+
+    # Class of a subtree, or None if it can return either class
+    def subtree_class(node):
+
+        if exported["feature"][node] < 0:
+
+            return exported["threshold"][node]
+
+        left = subtree_class(exported["left"][node])
+        right = subtree_class(exported["right"][node])
+
+        return left if left is not None and left == right else None
+
+    pruned = {"feature": [], "threshold": [], "left": [], "right": []}
+
+    def emit(node):
+
+        index = len(pruned["feature"])
+
+        for key in pruned:
+
+            pruned[key].append(0)
+
+        leafClass = subtree_class(node)
+
+        if leafClass is not None:
+
+            pruned["feature"][index] = -1
+            pruned["threshold"][index] = leafClass
+
+            return index
+
+        pruned["feature"][index] = exported["feature"][node]
+        pruned["threshold"][index] = exported["threshold"][node]
+
+        pruned["left"][index] = emit(exported["left"][node])
+        pruned["right"][index] = emit(exported["right"][node])
+
+        return index
+
+    emit(0)
+
+    return pruned
+
+
+# Python reference of the exported C logic, on raw readings
+def predict_reference(exported, temperature, humidity, gas):
+
+    x = [int(round(value * FIXED_SCALE)) for value in (temperature, humidity, gas)]
+
+    node = 0
+
+    while exported["feature"][node] >= 0:
+
+        feature = exported["feature"][node]
+
+        node = exported["left"][node] if x[feature] <= exported["threshold"][node] else exported["right"][node]
+
+    return exported["threshold"][node]
+
+
+# Function to render the exported tree as a C header for the sketch
+def render_header(exported, source):
+
+    def array(name, cType, values):
+
+        return f"const {cType} {name}[] PROGMEM = {{{', '.join(str(v) for v in values)}}};\n"
+
+    nodes = len(exported["feature"])
+
+    return (
+
+        f"// Generated by edgeExport.py from {source} on {datetime.now().strftime('%Y-%m-%d')}, do not edit\n"
+        "// Distilled anomaly tree, scaler folded in, thresholds in tenths of a unit\n"
+        "#ifndef EDGE_MODEL_H\n"
+        "#define EDGE_MODEL_H\n"
+        "\n"
+        "#include <avr/pgmspace.h>\n"
+        "\n"
+        f"#define EDGE_MODEL_SCALE {FIXED_SCALE}\n"
+        f"#define EDGE_MODEL_NODES {nodes}\n"
+        "\n"
+        + array("edgeFeature", "int8_t", exported["feature"])
+        + array("edgeThreshold", "int16_t", exported["threshold"])
+        + array("edgeLeft", "uint8_t", exported["left"])
+        + array("edgeRight", "uint8_t", exported["right"])
+        + "\n"
+        "// Returns 1 if the reading looks anomalous (smoke/fire possible), 0 otherwise\n"
+        "// Inputs are temperature, humidity and gas multiplied by EDGE_MODEL_SCALE\n"
+        "static inline uint8_t edgeModelPredict(int16_t temperature, int16_t humidity, int16_t gas) {\n"
+        "\n"
+        "  int16_t x[3] = {temperature, humidity, gas};\n"
+        "\n"
+        "  uint8_t node = 0;\n"
+        "  int8_t feature = (int8_t)pgm_read_byte(&edgeFeature[node]);\n"
+        "\n"
+        "  while (feature >= 0) {\n"
+        "\n"
+        "    int16_t threshold = (int16_t)pgm_read_word(&edgeThreshold[node]);\n"
+        "\n"
+        "    node = (x[feature] <= threshold) ? pgm_read_byte(&edgeLeft[node]) : pgm_read_byte(&edgeRight[node]);\n"
+        "    feature = (int8_t)pgm_read_byte(&edgeFeature[node]);\n"
+        "  }\n"
+        "\n"
+        "  return (uint8_t)pgm_read_word(&edgeThreshold[node]);\n"
+        "}\n"
+        "\n"
+        "#endif\n"
+    )
+
+
+# Function to check the exported logic against the original model on the dataset
+def verify(exported, model, scaler, dataset):
+
+    X = dataset[FEATURES].to_numpy(dtype=float)
+
+    teacher = teacher_labels(model, scaler, X)
+
+    # The car only ever sees integer readings
+    edge = np.array([predict_reference(exported, *row) for row in np.round(X)])
+
+    agreement = (edge == teacher).mean()
+
+    report = {"rows": len(X), "agreement_with_model": round(float(agreement), 4)}
+
+    if 'Anomaly' in dataset.columns:
+
+        labels = dataset['Anomaly'].to_numpy()
+
+        report["accuracy_vs_labels"] = round(float((edge == labels).mean()), 4)
+        report["anomaly_recall"] = round(float(edge[labels == 1].mean()), 4) if (labels == 1).any() else None
+        report["false_alarm_rate"] = round(float(edge[labels == 0].mean()), 4) if (labels == 0).any() else None
+
+    return report
+
+
+# Exporting the model to the sketch folder
+if __name__ == "__main__":
+
+    # Ignoring warnings
+    warnings.filterwarnings('ignore')
+
+    argParser = argparse.ArgumentParser(description="Export a trained model as a fixed-point C tree for the Arduino")
+
+    argParser.add_argument('--model', choices=sorted(ARTIFACTS), default='randomForest')
+    argParser.add_argument('--data', default='sensorData.csv')
+    argParser.add_argument('--output', default=os.path.join('..', 'Arduino', 'edgeModel.h'))
+    argParser.add_argument('--flash-budget', type=int, default=1024, help="bytes of flash for the tree")
+    argParser.add_argument('--max-depth', type=int, default=6)
+    argParser.add_argument('--min-agreement', type=float, default=0.98)
+
+    args = argParser.parse_args()
+
+    modelFile, scalerFile = ARTIFACTS[args.model]
+
+    model = load(modelFile)
+    scaler = load(scalerFile)
+
+    dataset = load_dataset(args.data)
+
+    student = distill(model, scaler, dataset[FEATURES].to_numpy(dtype=float), args.flash_budget, args.max_depth)
+
+    exported = export_tree(student, scaler)
+
+    report = verify(exported, model, scaler, dataset)
+
+    print(f"Tree depth {student.get_depth()}, {len(exported['feature'])} nodes, {len(exported['feature']) * NODE_BYTES} bytes of flash")
+
+    for key, value in report.items():
+
+        print(f"{key}: {value}")
+
+    if report["agreement_with_model"] < args.min_agreement:
+
+        print(f"❌ Agreement below {args.min_agreement}, header not written.")
+
+        sys.exit(1)
+
+    with open(args.output, 'w') as file:
+
+        file.write(render_header(exported, modelFile))
+
+    print(f"✅ Header written to {args.output}")
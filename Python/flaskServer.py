@@ -1,26 +1,43 @@
 # Importing the required libraries 
 import os
+import sys
 import csv
-import json
 import time
+import atexit
 import serial
 import pygame
 import requests
 from joblib import load
-from datetime import datetime
+from datetime import datetime, timedelta
 from threading import Thread, Lock
 from flask import Flask, request, Response
 from requests.exceptions import ConnectionError
+from commandChannel import CommandChannel
+from csvIndex import CsvTimeIndex
+from anomalyLabels import anomaly_labels
+from anomalyAlerts import AlertDispatcher
+from serialParser import SerialMessageParser, DistanceSeries
+import serialParser as messages
+import commandChannel as commands
+from profilerEndpoints import profiler, positive_arg
+from telemetryRate import TelemetryRateController
+from telemetryCompression import TelemetryCompressor, SWINGING_DOOR, CHANNELS
 
 
 # Creating the Flask backend server
 app = Flask(__name__)
 
-# Opening serial connection to Arduino
-serialCon = serial.Serial('COM7', 9600) 
+# Admin profiling routes (/admin/profile/..., /admin/memory/...)
+app.register_blueprint(profiler)
 
-# Giving Bluetooth time to initialize
-time.sleep(2)
+# Serial connection to Arduino, opened by open_serial() when the server starts
+serialCon = None
+
+# Shared command channel for keyboard and rate commands
+commandChannel = CommandChannel(serialCon)
+
+# Adaptive telemetry rate: faster reporting as the anomaly risk rises
+rateController = TelemetryRateController(commandChannel, probThreshold=0.5, gasThreshold=300.0)
 
 # URL of the Flask server
 url = 'http://127.0.0.1:5000/receive_data'
@@ -29,16 +46,82 @@ url = 'http://127.0.0.1:5000/receive_data'
 csvFile = 'sensorData.csv'
 
 # Loading pre-trained model and scaler
-model = load('randomForest_model.joblib')
-scaler = load('randomForest_scaler.joblib')
+model = load('randomForest_Model.joblib')
+scaler = load('randomForest_Scaler.joblib')
 
 # Thread-safe protection, for data reading and fetching sync
 dataLock = Lock()
 
+# Per-channel compression before storage: maximum error per channel and
+# heartbeat interval (seconds); anomalies and anomaly transitions are always stored
+compressor = TelemetryCompressor(
+
+    method=SWINGING_DOOR,
+    maxError={"Temperature": 0.5, "Humidity": 1.0, "Gas": 5.0},
+    maxInterval=60.0
+)
+
+# Serializing compressor state and CSV appends
+csvLock = Lock()
+
+# Sparse time index of the CSV (sensorData.csv.idx), for /csv_data range queries
+csvIndex = None
+
+# Anomaly alerts, delivered off the serial loop to comma-separated webhook URLs
+alertDispatcher = AlertDispatcher(
+
+    [target for target in os.environ.get('ALERT_WEBHOOKS', '').split(',') if target],
+    incidentFile='incidents.jsonl',
+    queueDir='alert_queue',
+    quietSeconds=30.0
+)
+
+# Forwarding each reading to /receive_data (disabled when storage runs in-process)
+forwardToServer = True
+
 # Variable to store the latest temperature, humidity and Gas values
 latestData = {"Temperature": None, "Humidity": None, "Gas":None}
 
 
+# Function to open the serial connection to Arduino
+def open_serial(port='COM7', baudRate=9600):
+
+    global serialCon
+
+    serialCon = serial.Serial(port, baudRate)
+
+    # Giving Bluetooth time to initialize
+    time.sleep(2)
+
+    commandChannel.serialCon = serialCon
+
+    return serialCon
+
+
+# Function to run the anomaly model over a batch of readings
+# Returns the anomaly status and anomaly probability per reading
+def detect_anomalies(readings):
+
+    inputScaled = scaler.transform(readings)
+
+    predictions = model.predict(inputScaled)
+
+    anomalyStatus = [int(status) for status in anomaly_labels(model, predictions)]
+
+    # Anomaly probability, falling back to the verdict for models without one
+    if hasattr(model, 'predict_proba'):
+
+        anomalyColumn = list(model.classes_).index(1)
+
+        probabilities = [float(proba[anomalyColumn]) for proba in model.predict_proba(inputScaled)]
+
+    else:
+
+        probabilities = [float(status) for status in anomalyStatus]
+
+    return anomalyStatus, probabilities
+
+
 # Waiting for server to be ready
 def wait_for_server(url, retries=10, delay=1):
     
@@ -161,9 +244,7 @@ def keyboard_control():
                 # Sending commands to Arduino Uno via Bluetooth
                 if command and command != last_command:
     
-                    serialCon.write((command + "\n").encode())
-    
-                    print(f"Sent command: {command}")
+                    commandChannel.send(command)
     
                     last_command = command
 
@@ -203,106 +284,176 @@ def read_and_save_to_csv():
 
             dataStr = serialCon.readline().decode('utf-8').rstrip()
 
-            print("Received data from Arduino:", dataStr)
-            
-            # Deserializing JSON string to Python dictionary
-            try:
-                
-                dataDict = json.loads(dataStr)
-            
-            except json.JSONDecodeError:
-
-                print("Invalid JSON format received from Arduino:", dataStr)
-            
-                continue
-            
-            # Checking if the received data dictionary contains all required keys
-            if all(key in dataDict for key in ["Temperature", "Humidity", "Gas"]):
-                
-                temperature = float(dataDict["Temperature"])
-                humidity = float(dataDict["Humidity"])
-                gas = int(dataDict["Gas"])
+            # Routing the line to its handler by type, JSON is only decoded for telemetry
+            parser.dispatch(dataStr)
 
-                # Real-time anomaly detection
-                inputScaled = scaler.transform([[temperature, humidity, gas]])
-                
-                prediction = model.predict(inputScaled)[0]
-                
-                anomalyStatus = 1 if prediction == -1 else 0
 
-                if anomalyStatus == 1:
-                
-                    print("⚠️ Anomaly Detected (Smoke/Fire Possible)")
-                
-                else:
-                
-                    print("✅ Normal Reading")
-                
-                # Updating the latest data
-                with dataLock:
-                    
-                    latestData.update({
-                        
-                        "Temperature": temperature,
-                        
-                        "Humidity": humidity,
-                        
-                        "Gas": gas,
-                        
-                        "Anomaly": anomalyStatus
-                    })
-
-                # Saving the data to the CSV file
-                save_to_csv(temperature, humidity, gas, anomalyStatus)
-                
-                # Sending the data to the Flask server
-                send_data_to_server(dataDict)
-            
-            else:
-            
-                print("Incomplete data received from Arduino:", dataDict)
+# Function to handle a JSON telemetry message from Arduino
+def handle_telemetry(dataDict):
 
+    print("Received data from Arduino:", dataDict)
+
+    # Checking if the received data dictionary contains all required keys
+    if all(key in dataDict for key in ["Temperature", "Humidity", "Gas"]):
+
+        temperature = float(dataDict["Temperature"])
+        humidity = float(dataDict["Humidity"])
+        gas = int(dataDict["Gas"])
+
+        # Real-time anomaly detection
+        (anomalyStatus,), (probability,) = detect_anomalies([[temperature, humidity, gas]])
+
+        # Adjusting the car's reporting interval to the current risk
+        rateController.update(probability, gas)
+
+        if anomalyStatus == 1:
+
+            print("⚠️ Anomaly Detected (Smoke/Fire Possible)")
+
+        else:
+
+            print("✅ Normal Reading")
+
+        # Handing the verdict to the alert dispatcher, never blocks
+        alertDispatcher.submit(anomalyStatus, {"Temperature": temperature, "Humidity": humidity, "Gas": gas})
+
+        # Updating the latest data
+        with dataLock:
+
+            latestData.update({
+
+                "Temperature": temperature,
+
+                "Humidity": humidity,
+
+                "Gas": gas,
+
+                "Anomaly": anomalyStatus
+            })
+
+        # Saving the data to the CSV file
+        save_to_csv(temperature, humidity, gas, anomalyStatus)
+
+        # Sending the data to the Flask server
+        if forwardToServer:
+
+            send_data_to_server(dataDict)
+
+    else:
+
+        print("Incomplete data received from Arduino:", dataDict)
+
+
+# Function to print plain-text messages that need no further handling
+def handle_text(messageType):
+
+    return lambda payload: print(f"Arduino [{messageType}]:", payload)
+
+
+# Function to handle the car's on-board anomaly alert, raised before host scoring
+def handle_edge_alert(payload):
+
+    print("🚨 Edge anomaly detected on the car (motors stopped)")
+
+    with dataLock:
+
+        reading = {key: latestData[key] for key in CHANNELS if latestData[key] is not None}
+
+    alertDispatcher.submit(1, dict(reading, Source="edge"))
+
+
+# Ultrasonic distance readings, kept as their own time series
+distanceSeries = DistanceSeries('distanceData.csv')
+
+atexit.register(distanceSeries.close)
+
+# Serial stream parser: message type -> handler
+parser = SerialMessageParser()
+
+parser.on(messages.TELEMETRY, handle_telemetry)
+parser.on(messages.DISTANCE, distanceSeries.record)
+parser.on(messages.EDGE_ALERT, handle_edge_alert)
+parser.on(messages.COMMAND_ACK, lambda value: commandChannel.acknowledge(commands.MOVE, value))
+parser.on(messages.SPEED_ACK, lambda value: commandChannel.acknowledge(commands.SPEED, value))
+parser.on(messages.RATE_ACK, lambda value: commandChannel.acknowledge(commands.RATE, value))
+parser.on(messages.MODE_ACK, lambda value: commandChannel.acknowledge(commands.MODE, value))
+parser.on(messages.COMMAND_REJECTED, lambda reason: commandChannel.reject(commands.MOVE, reason))
+parser.on(messages.SPEED_REJECTED, lambda reason: commandChannel.reject(commands.SPEED, reason))
+parser.on(messages.RATE_REJECTED, lambda reason: commandChannel.reject(commands.RATE, reason))
+
+for messageType in (messages.OBSTACLE, messages.SENSOR_TIMEOUT, messages.INFO, messages.UNKNOWN, messages.MALFORMED):
+
+    parser.on(messageType, handle_text(messageType))
+
+
+# Function to save data to CSV file, after per-channel compression
+# timeStamp is when the reading arrived (epoch seconds), now by default
+def save_to_csv(temperature, humidity, gas, anomaly, timeStamp=None):
+
+    values = dict(zip(CHANNELS, [temperature, humidity, gas]))
+
+    with csvLock:
+
+        rows = compressor.offer(timeStamp or time.time(), values, anomaly)
+
+        if not rows:
+
+            print(f"Within compression error — skipping data save ({compressor.ratio():.1f}x).")
+
+            return
+
+        write_rows(rows)
+
+
+# Function to get the time index of the current CSV file
+def get_csv_index():
+
+    global csvIndex
+
+    if csvIndex is None or csvIndex.csvFile != csvFile:
+
+        csvIndex = CsvTimeIndex(csvFile, everyRows=500, everySeconds=600)
+
+    return csvIndex
+
+
+# Function to append compressed rows to the CSV file
+def write_rows(rows):
 
-# Function to save data to CSV file
-def save_to_csv(temperature, humidity, gas, anomaly):
-    
     fileExists = os.path.exists(csvFile)
-    
-    # Reading the last row, excluding timestamp
-    if fileExists:
-    
-        try:
-    
-            with open(csvFile, 'r') as file:
-    
-                rows = list(csv.reader(file))
-    
-                if len(rows) > 1:
-    
-                    last_row = rows[-1]
-    
-                    if last_row[1:] == [str(temperature), str(humidity), str(gas), str(anomaly)]:
-    
-                        print("Duplicate entry detected — skipping data save.")
-    
-                        return
-    
-        except Exception as e:
-    
-            print(f"Error checking for duplicates: {e}")
 
-    # Preparing timestamp and write data
-    timeStamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
+    index = get_csv_index()
+
     with open(csvFile, mode='a', newline='') as file:
-    
+
         writer = csv.writer(file)
-    
+
         if not fileExists:
-    
+
+            index.reset()
+
             writer.writerow(["Timestamp", "Temperature", "Humidity", "Gas", "Anomaly"])
-    
-        writer.writerow([timeStamp, temperature, humidity, gas, anomaly])
+
+        for timeStamp, values, anomaly in rows:
+
+            # Preparing timestamp and write data
+            timeStamp = datetime.fromtimestamp(timeStamp).strftime('%Y-%m-%d %H:%M:%S')
+
+            # Recording where the row starts, for range queries
+            index.note(timeStamp, file.tell())
+
+            writer.writerow([timeStamp] + [values[channel] for channel in CHANNELS] + [anomaly])
+
+
+# Function to store the buffered reading on shutdown
+def flush_csv():
+
+    with csvLock:
+
+        write_rows(compressor.flush())
+
+
+atexit.register(flush_csv)
 
 
 
@@ -350,10 +501,70 @@ def get_data():
             return {"message": "No data received from Arduino yet"}, 404
 
 
-# Flask route to serve the CSV file
+# Recent ultrasonic distance readings, e.g. /distance_data?count=50
+@app.route('/distance_data')
+def get_distance_data():
+
+    try:
+
+        count = positive_arg('count', 100, cast=int)
+
+    except ValueError as error:
+
+        return {"message": str(error)}, 400
+
+    return {"readings": [{"Timestamp": timeStamp, "Distance": distance} for timeStamp, distance in distanceSeries.latest(count)]}
+
+
+# Serial message counters per type, commands still waiting for an ack and the last rejected ones
+@app.route('/parser_stats')
+def get_parser_stats():
+
+    return dict(parser.report(), unacknowledged=commandChannel.unacknowledged(), rejected=commandChannel.rejected)
+
+
+# Function to turn a query bound into the CSV timestamp format
+# Accepts "2025-01-01 10:00:00", ISO 8601 ("2025-01-01T10:00") or seconds ago ("-600")
+def parse_bound(value):
+
+    if value is None:
+
+        return None
+
+    if value.startswith('-') and value[1:].replace('.', '', 1).isdigit():
+
+        moment = datetime.now() - timedelta(seconds=float(value[1:]))
+
+    else:
+
+        moment = datetime.fromisoformat(value)
+
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+# Flask route to serve the CSV file, or a time range of it
+# e.g. /csv_data?from=2025-01-01T10:00&to=2025-01-01T11:00 or /csv_data?from=-600
 @app.route('/csv_data')
 def serve_csv():
 
+    # Range query: seeking through the time index and streaming only the range
+    if 'from' in request.args or 'to' in request.args:
+
+        if not os.path.exists(csvFile):
+
+            return "CSV file not found", 404
+
+        try:
+
+            start = parse_bound(request.args.get('from'))
+            end = parse_bound(request.args.get('to'))
+
+        except ValueError:
+
+            return "Invalid 'from' or 'to' timestamp", 400
+
+        return Response(get_csv_index().iter_range(start, end), mimetype='text/csv')
+
     # Checking if CSV file exists
     if os.path.exists(csvFile):
         
@@ -370,13 +581,27 @@ def serve_csv():
 
 # Running the main program
 if __name__ == "__main__":
-   
+
+    # Optional multiprocess layout: ingest, inference and storage/HTTP as separate processes
+    if '--pipeline' in sys.argv:
+
+        from pipeline import run_pipeline
+
+        run_pipeline()
+
+        sys.exit(0)
+
+    open_serial()
+
     # Running Flask server in a separate thread
-    serverThread = Thread(target=app.run, kwargs={'host':'0.0.0.0', 'port':5000, 'threaded': True})
+    serverThread = Thread(target=app.run, kwargs={'host':'0.0.0.0', 'port':5000, 'threaded': True}, name='flask-server')
     serverThread.start()
 
+    # Starting the anomaly alert workers
+    alertDispatcher.start()
+
     # Starting reading data from Arduino and saving to the CSV file in a separate thread
-    Thread(target=read_and_save_to_csv).start()
+    Thread(target=read_and_save_to_csv, name='serial-reader').start()
 
     # Starting the keyboard control thread
-    Thread(target=keyboard_control).start()
\ No newline at end of file
+    Thread(target=keyboard_control, name='keyboard').start()
\ No newline at end of file
@@ -9,13 +9,16 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import make_scorer, recall_score
 from sklearn.model_selection import GridSearchCV, StratifiedKFold
 from sklearn.metrics import classification_report, confusion_matrix
+from telemetryCompression import load_reconstructed
 
 
 # Ignoring warnings
 warnings.filterwarnings('ignore')
 
 # Loading the sensor dataset
-dataset = pd.read_csv('sensorData.csv')
+# The CSV is compressed (mostly anomalies and changes), so it is resampled
+# back to the 2 s reading interval to keep the original class balance
+dataset = load_reconstructed('sensorData.csv')
 
 # Removing spaces in column names
 dataset.columns = dataset.columns.str.strip()
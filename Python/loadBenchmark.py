@@ -0,0 +1,448 @@
+# Importing the required libraries
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import platform
+import threading
+import subprocess
+import requests
+from datetime import datetime
+from syntheticTelemetry import Settings, generate, min_chunk_rows
+
+
+# Routes exercised by the benchmark: name -> (method, path)
+ROUTES = {
+
+    "index": ("GET", "/"),
+    "receive_data_get": ("GET", "/receive_data"),
+    "receive_data_post": ("POST", "/receive_data"),
+    "csv_data": ("GET", "/csv_data")
+}
+
+# Body for POST /receive_data, as sent by the data logger
+POST_BODY = {"Temperature": 24.0, "Humidity": 51.0, "Gas": 63}
+
+
+# Function to write a sensorData.csv-like file with the given number of rows
+def write_csv(path, rows, seed=42):
+
+    # One chunk, so small files are generated in-process
+    generate(path, Settings(rows, seed, chunkRows=max(rows, min_chunk_rows())), workers=1)
+
+
+# Function to read the resident set size (bytes) of a process
+def process_rss(pid):
+
+    try:
+
+        import psutil
+
+        return psutil.Process(pid).memory_info().rss
+
+    except ImportError:
+
+        pass
+
+    try:
+
+        with open(f'/proc/{pid}/status') as file:
+
+            for line in file:
+
+                if line.startswith('VmRSS:'):
+
+                    return int(line.split()[1]) * 1024
+
+    except OSError:
+
+        pass
+
+    return None
+
+
+# Server side: the Flask app with a simulated serial source feeding it
+def serve(port, csvFile, rate):
+
+    import flaskServer
+    from simulatedSerial import SimulatedSerial
+
+    flaskServer.csvFile = csvFile
+    flaskServer.url = f'http://127.0.0.1:{port}/receive_data'
+
+    flaskServer.serialCon = SimulatedSerial(rate=rate)
+    flaskServer.commandChannel.serialCon = flaskServer.serialCon
+
+    threading.Thread(target=flaskServer.read_and_save_to_csv, name='serial-reader', daemon=True).start()
+
+    # Quiet request logging, it would dominate the measurement
+    import logging
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    flaskServer.app.run(host='127.0.0.1', port=port, threaded=True)
+
+
+# Client side: one running server process under test
+class ServerUnderTest:
+
+    def __init__(self, port, csvFile, rate):
+
+        self.port = port
+        self.baseUrl = f'http://127.0.0.1:{port}'
+
+        self.process = subprocess.Popen(
+
+            [sys.executable, os.path.abspath(__file__), '--serve', '--port', str(port), '--csv', csvFile, '--rate', str(rate)],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        self._wait_ready()
+
+
+    def _wait_ready(self, timeout=60):
+
+        deadline = time.time() + timeout
+
+        while time.time() < deadline:
+
+            try:
+
+                requests.get(self.baseUrl + '/', timeout=1)
+
+                return
+
+            except requests.RequestException:
+
+                time.sleep(0.2)
+
+        self.stop()
+
+        raise RuntimeError("Server under test did not start")
+
+
+    def rss(self):
+
+        return process_rss(self.process.pid)
+
+
+    def stop(self):
+
+        self.process.terminate()
+
+        try:
+
+            self.process.wait(timeout=10)
+
+        except subprocess.TimeoutExpired:
+
+            self.process.kill()
+
+
+# Function to drive one route with a fixed number of concurrent clients
+def drive(server, route, concurrency, duration, timeout=30.0):
+
+    method, path = ROUTES[route]
+
+    url = server.baseUrl + path
+
+    latencies = []
+    errors = {}
+    rssSamples = []
+
+    lock = threading.Lock()
+
+    deadline = time.time() + duration
+
+    def client():
+
+        session = requests.Session()
+
+        while time.time() < deadline:
+
+            start = time.perf_counter()
+
+            try:
+
+                if method == "POST":
+
+                    response = session.post(url, json=POST_BODY, timeout=timeout)
+
+                else:
+
+                    response = session.get(url, timeout=timeout)
+
+                # /receive_data GET is 404 until the first reading, which is not an error
+                failed = response.status_code >= 500 or (response.status_code >= 400 and response.status_code != 404)
+
+                error = f"http_{response.status_code}" if failed else None
+
+            except requests.RequestException as e:
+
+                error = type(e).__name__
+
+            elapsed = time.perf_counter() - start
+
+            with lock:
+
+                if error:
+
+                    errors[error] = errors.get(error, 0) + 1
+
+                else:
+
+                    latencies.append(elapsed)
+
+    clients = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+
+    started = time.time()
+
+    for thread in clients:
+
+        thread.start()
+
+    # Sampling server memory while the clients run
+    while any(thread.is_alive() for thread in clients):
+
+        rssSamples.append(server.rss())
+
+        time.sleep(0.5)
+
+    return summarize(latencies, errors, time.time() - started, rssSamples)
+
+
+# Function to summarize one run: throughput, latency percentiles (ms), errors and RSS
+def summarize(latencies, errors, elapsed, rssSamples):
+
+    latencies = sorted(latencies)
+
+    errorCount = sum(errors.values())
+
+    total = len(latencies) + errorCount
+
+    def percentile(p):
+
+        if not latencies:
+
+            return None
+
+        return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 3)
+
+    rssSamples = [sample for sample in rssSamples if sample]
+
+    return {
+
+        "requests": total,
+        "throughput_per_s": round(len(latencies) / elapsed, 2),
+        "latency_ms": {"p50": percentile(50), "p90": percentile(90), "p99": percentile(99), "max": percentile(100)},
+        "error_rate": round(errorCount / total, 4) if total else 0.0,
+        "errors": dict(sorted(errors.items())),
+        "rss_mb": {"max": round(max(rssSamples) / 2 ** 20, 1), "last": round(rssSamples[-1] / 2 ** 20, 1)} if rssSamples else None
+    }
+
+
+# Route sweep: every route at every concurrency, and /csv_data at every CSV size
+def run_sweep(args, workDir):
+
+    results = {"routes": {}, "csv_sizes": {}}
+
+    csvFile = os.path.join(workDir, 'sensorData.csv')
+
+    write_csv(csvFile, args.base_rows)
+
+    server = ServerUnderTest(args.port, csvFile, args.rate)
+
+    try:
+
+        for route in ROUTES:
+
+            for concurrency in args.concurrency:
+
+                print(f"Route {route} with {concurrency} clients...")
+
+                results["routes"][f"{route}@{concurrency}"] = drive(server, route, concurrency, args.duration)
+
+    finally:
+
+        server.stop()
+
+    for rows in args.csv_rows:
+
+        write_csv(csvFile, rows)
+
+        server = ServerUnderTest(args.port, csvFile, args.rate)
+
+        try:
+
+            concurrency = max(args.concurrency)
+
+            print(f"/csv_data with {rows} rows and {concurrency} clients...")
+
+            results["csv_sizes"][str(rows)] = dict(
+
+                drive(server, "csv_data", concurrency, args.duration),
+                csv_bytes=os.path.getsize(csvFile)
+            )
+
+        finally:
+
+            server.stop()
+
+    return results
+
+
+# Soak run: mixed traffic on all routes, with RSS over time
+def run_soak(args, workDir):
+
+    csvFile = os.path.join(workDir, 'sensorData.csv')
+
+    write_csv(csvFile, args.base_rows)
+
+    server = ServerUnderTest(args.port, csvFile, args.rate)
+
+    timeline = []
+    routeResults = {}
+
+    try:
+
+        runners = [threading.Thread(target=lambda route=route: routeResults.__setitem__(route, drive(server, route, 2, args.soak)), daemon=True)
+                   for route in ROUTES]
+
+        start = time.time()
+
+        for runner in runners:
+
+            runner.start()
+
+        while any(runner.is_alive() for runner in runners):
+
+            rss = server.rss()
+
+            timeline.append({"t": round(time.time() - start, 1), "rss_mb": round(rss / 2 ** 20, 1) if rss else None})
+
+            time.sleep(args.sample_every)
+
+    finally:
+
+        server.stop()
+
+    return {"duration_s": args.soak, "routes": routeResults, "rss_timeline": timeline}
+
+
+# Function to compare two result files and flag regressions
+def compare(oldFile, newFile, threshold=0.10, errorThreshold=0.001):
+
+    with open(oldFile) as file:
+
+        old = json.load(file)
+
+    with open(newFile) as file:
+
+        new = json.load(file)
+
+    regressions = 0
+
+    for section in ("routes", "csv_sizes"):
+
+        for key in sorted(set(old.get(section, {})) & set(new.get(section, {}))):
+
+            before, after = old[section][key], new[section][key]
+
+            for metric, higherIsWorse in (("throughput_per_s", False), ("p99", True)):
+
+                a = before["latency_ms"][metric] if metric == "p99" else before[metric]
+                b = after["latency_ms"][metric] if metric == "p99" else after[metric]
+
+                if not a or b is None:
+
+                    continue
+
+                change = (b - a) / a
+
+                worse = change > threshold if higherIsWorse else change < -threshold
+
+                regressions += worse
+
+                print(f"{'REGRESSION ' if worse else ''}{section}/{key} {metric}: {a} -> {b} ({change:+.1%})")
+
+            # Error rates are compared in absolute terms, so errors appearing from 0 count
+            a, b = before.get("error_rate"), after.get("error_rate")
+
+            if a is None or b is None:
+
+                continue
+
+            worse = b - a > errorThreshold
+
+            regressions += worse
+
+            print(f"{'REGRESSION ' if worse else ''}{section}/{key} error_rate: {a} -> {b} ({(b - a) * 100:+.2f} pts)")
+
+    return regressions
+
+
+# Running the benchmark, serving the app (--serve), or comparing two runs (--compare)
+if __name__ == "__main__":
+
+    argParser = argparse.ArgumentParser(description="HTTP load and soak benchmark for the Flask endpoints")
+
+    argParser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    argParser.add_argument('--csv', help=argparse.SUPPRESS)
+    argParser.add_argument('--port', type=int, default=5055)
+    argParser.add_argument('--rate', type=float, default=5.0, help="simulated serial readings per second")
+    argParser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    argParser.add_argument('--duration', type=float, default=10.0, help="seconds per route/concurrency run")
+    argParser.add_argument('--base-rows', type=int, default=2000, help="CSV rows for the route sweep")
+    argParser.add_argument('--csv-rows', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    argParser.add_argument('--soak', type=float, default=0, help="soak duration in seconds (0 = no soak)")
+    argParser.add_argument('--sample-every', type=float, default=5.0, help="soak RSS sampling interval")
+    argParser.add_argument('--output', default=None, help="result file (default: benchmark_results/<timestamp>.json)")
+    argParser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'))
+    argParser.add_argument('--threshold', type=float, default=0.10, help="relative change counted as a regression")
+    argParser.add_argument('--error-threshold', type=float, default=0.001, help="absolute error rate increase counted as a regression")
+
+    args = argParser.parse_args()
+
+    if args.serve:
+
+        serve(args.port, args.csv, args.rate)
+
+        sys.exit(0)
+
+    if args.compare:
+
+        sys.exit(1 if compare(*args.compare, threshold=args.threshold, errorThreshold=args.error_threshold) else 0)
+
+    workDir = tempfile.mkdtemp()
+
+    results = {
+
+        "meta": {
+
+            "date": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {key: value for key, value in vars(args).items() if key not in ('serve', 'csv', 'compare', 'output')}
+        }
+    }
+
+    results.update(run_sweep(args, workDir))
+
+    if args.soak:
+
+        results["soak"] = run_soak(args, workDir)
+
+    output = args.output or os.path.join('benchmark_results', f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+
+    # Sorted keys and fixed indentation, so result files diff cleanly between versions
+    with open(output, 'w') as file:
+
+        json.dump(results, file, indent=2, sort_keys=True)
+
+    print(f"Results saved to {output}")
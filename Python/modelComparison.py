@@ -7,6 +7,7 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestClassifier, IsolationForest
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score, roc_curve
+from telemetryCompression import load_reconstructed
 
 
 # Function to measure execution time
@@ -28,7 +29,9 @@ def measure_time(model, X_train, y_train, X_test, y_test):
 
 
 # Loading and cleaning dataset 
-dataset = pd.read_csv('sensorData.csv')
+# The CSV is compressed (mostly anomalies and changes), so it is resampled
+# back to the 2 s reading interval to keep the original class balance
+dataset = load_reconstructed('sensorData.csv')
 
 # Removing irrelevant columns
 dataset.columns = dataset.columns.str.strip()
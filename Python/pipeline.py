@@ -0,0 +1,727 @@
+# Importing the required libraries
+import os
+import sys
+import time
+import json
+import queue
+import struct
+import tempfile
+import multiprocessing as mp
+from threading import Thread
+from collections import deque
+from multiprocessing import shared_memory
+
+
+# Fixed-size reading record passed between stages:
+# sequence, ingest time, temperature, humidity, gas, anomaly, probability, inference time
+RECORD = struct.Struct('<Qdfffifd')
+
+# Ring header: head (written by the producer) and tail (written by the consumer),
+# on separate 64-byte lines so the two processes do not share a cache line
+HEAD_OFFSET = 0
+TAIL_OFFSET = 64
+HEADER_SIZE = 128
+
+COUNTER = struct.Struct('<Q')
+
+# How often the ingest stage publishes its parser and command state (seconds)
+STATUS_SECONDS = 1.0
+
+
+# Single-producer / single-consumer ring buffer of RECORDs in shared memory
+# Readings stay in the ring until the consumer commits them, so a restarted
+# stage resumes from the last committed record (at-least-once delivery)
+class RingBuffer:
+
+    def __init__(self, sharedMemory, capacity, owner=False):
+
+        self.sharedMemory = sharedMemory
+        self.capacity = capacity
+        self.owner = owner
+
+        self.buffer = sharedMemory.buf
+
+
+    @classmethod
+    def create(cls, capacity):
+
+        sharedMemory = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity * RECORD.size)
+
+        sharedMemory.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+
+        return cls(sharedMemory, capacity, owner=True)
+
+
+    @classmethod
+    def attach(cls, name, capacity):
+
+        return cls(shared_memory.SharedMemory(name=name), capacity)
+
+
+    @property
+    def name(self):
+
+        return self.sharedMemory.name
+
+
+    def _get(self, offset):
+
+        return COUNTER.unpack_from(self.buffer, offset)[0]
+
+
+    def _set(self, offset, value):
+
+        COUNTER.pack_into(self.buffer, offset, value)
+
+
+    def head(self):
+
+        return self._get(HEAD_OFFSET)
+
+
+    def tail(self):
+
+        return self._get(TAIL_OFFSET)
+
+
+    def __len__(self):
+
+        return self.head() - self.tail()
+
+
+    # Producer: writing one record, waiting while the ring is full
+    def put(self, record, stopEvent=None):
+
+        head = self.head()
+
+        while head - self.tail() >= self.capacity:
+
+            if stopEvent is not None and stopEvent.is_set():
+
+                return False
+
+            time.sleep(0.0005)
+
+        RECORD.pack_into(self.buffer, HEADER_SIZE + (head % self.capacity) * RECORD.size, *record)
+
+        # Publishing the record only after it is fully written
+        self._set(HEAD_OFFSET, head + 1)
+
+        return True
+
+
+    # Consumer: reading up to maxCount records without removing them,
+    # after the first `skip` ones (read earlier but not committed yet)
+    def peek(self, maxCount, skip=0):
+
+        start = self.tail() + skip
+
+        count = max(min(self.head() - start, maxCount), 0)
+
+        return [RECORD.unpack_from(self.buffer, HEADER_SIZE + ((start + i) % self.capacity) * RECORD.size)
+                for i in range(count)]
+
+
+    # Last record written by the producer, even if already consumed
+    def last(self):
+
+        head = self.head()
+
+        if head == 0:
+
+            return None
+
+        return RECORD.unpack_from(self.buffer, HEADER_SIZE + ((head - 1) % self.capacity) * RECORD.size)
+
+
+    # Consumer: removing records once they are fully processed
+    def commit(self, count):
+
+        self._set(TAIL_OFFSET, self.tail() + count)
+
+
+    def close(self):
+
+        self.buffer = None
+
+        self.sharedMemory.close()
+
+        if self.owner:
+
+            try:
+
+                self.sharedMemory.unlink()
+
+            except FileNotFoundError:
+
+                pass
+
+
+# Command channel for stages without the serial port: commands are forwarded
+# to the ingest process, which owns the port
+class QueuedCommandChannel:
+
+    def __init__(self, commandQueue):
+
+        self.commandQueue = commandQueue
+
+
+    def send(self, command):
+
+        self.commandQueue.put(command)
+
+
+# Ingest-side state for the HTTP routes, which run in the storage process:
+# parser counters, command acks and recent distances, shared through a JSON file
+class IngestStatus:
+
+    def __init__(self, path):
+
+        self.path = path
+
+
+    # Ingest stage: writing a snapshot, replaced atomically so readers never see half of one
+    def write(self, parser, commandChannel, distanceSeries):
+
+        snapshot = {
+
+            "report": parser.report(),
+            "unacknowledged": commandChannel.unacknowledged(),
+            "rejected": commandChannel.rejected,
+            "distances": distanceSeries.latest(distanceSeries.recent.maxlen)
+        }
+
+        temporary = self.path + '.tmp'
+
+        with open(temporary, 'w') as file:
+
+            json.dump(snapshot, file)
+
+        os.replace(temporary, self.path)
+
+
+    def read(self):
+
+        try:
+
+            with open(self.path) as file:
+
+                return json.load(file)
+
+        except (OSError, ValueError):
+
+            return {}
+
+
+    # Same calls the routes make on the parser, command channel and distance series
+    def report(self):
+
+        return self.read().get("report", {"elapsed_seconds": 0.0, "total": 0, "types": {}})
+
+
+    def unacknowledged(self):
+
+        return self.read().get("unacknowledged", {})
+
+
+    @property
+    def rejected(self):
+
+        return self.read().get("rejected", {})
+
+
+    def latest(self, count=100):
+
+        if count <= 0:
+
+            return []
+
+        return [tuple(reading) for reading in self.read().get("distances", [])][-count:]
+
+
+# Function to open the serial port, or a simulated source for benchmarks
+def open_source(source):
+
+    if source.get('simulated') is not None:
+
+        from simulatedSerial import SimulatedSerial
+
+        return SimulatedSerial(**source['simulated'])
+
+    import serial
+
+    serialCon = serial.Serial(source.get('port', 'COM7'), source.get('baudRate', 9600))
+
+    # Giving Bluetooth time to initialize
+    time.sleep(2)
+
+    return serialCon
+
+
+# Stage 1: serial ingest and parsing, telemetry goes to the inference ring
+def ingest_stage(outName, capacity, commandQueue, alertQueue, stopEvent, readyEvents, source, statusFile):
+
+    from commandChannel import CommandChannel
+    from serialParser import SerialMessageParser, DistanceSeries
+    import serialParser as messages
+    import commandChannel as commands
+
+    ring = RingBuffer.attach(outName, capacity)
+
+    # Reading only once downstream stages have loaded, so start-up is not queued
+    for readyEvent in readyEvents:
+
+        readyEvent.wait()
+
+    serialCon = open_source(source)
+
+    commandChannel = CommandChannel(serialCon)
+
+    distanceSeries = DistanceSeries(source.get('distanceFile', 'distanceData.csv'))
+
+    parser = SerialMessageParser()
+
+    # Reading time, set just before each line is dispatched
+    readAt = [0.0]
+
+    # Last complete reading, attached to edge alerts
+    latestReading = {}
+
+    def handle_telemetry(dataDict):
+
+        if all(key in dataDict for key in ["Temperature", "Humidity", "Gas"]):
+
+            latestReading.update({key: dataDict[key] for key in ["Temperature", "Humidity", "Gas"]})
+
+            record = (ring.head(), readAt[0], float(dataDict["Temperature"]), float(dataDict["Humidity"]),
+                      float(dataDict["Gas"]), 0, 0.0, 0.0)
+
+            ring.put(record, stopEvent)
+
+    # The car's on-board alert goes to the dispatcher in the inference stage
+    def handle_edge_alert(payload):
+
+        print("🚨 Edge anomaly detected on the car (motors stopped)")
+
+        alertQueue.put(dict(latestReading, Source="edge"))
+
+    parser.on(messages.TELEMETRY, handle_telemetry)
+    parser.on(messages.DISTANCE, distanceSeries.record)
+    parser.on(messages.EDGE_ALERT, handle_edge_alert)
+    parser.on(messages.COMMAND_ACK, lambda value: commandChannel.acknowledge(commands.MOVE, value))
+    parser.on(messages.SPEED_ACK, lambda value: commandChannel.acknowledge(commands.SPEED, value))
+    parser.on(messages.RATE_ACK, lambda value: commandChannel.acknowledge(commands.RATE, value))
+    parser.on(messages.MODE_ACK, lambda value: commandChannel.acknowledge(commands.MODE, value))
+    parser.on(messages.COMMAND_REJECTED, lambda reason: commandChannel.reject(commands.MOVE, reason))
+    parser.on(messages.SPEED_REJECTED, lambda reason: commandChannel.reject(commands.SPEED, reason))
+    parser.on(messages.RATE_REJECTED, lambda reason: commandChannel.reject(commands.RATE, reason))
+
+    status = IngestStatus(statusFile)
+
+    lastStatus = 0.0
+
+    while not stopEvent.is_set():
+
+        # Publishing counters, acks and distances for /parser_stats and /distance_data
+        if time.time() - lastStatus >= STATUS_SECONDS:
+
+            status.write(parser, commandChannel, distanceSeries)
+
+            lastStatus = time.time()
+
+        # Forwarding commands from the other processes to Arduino
+        try:
+
+            while True:
+
+                commandChannel.send(commandQueue.get_nowait())
+
+        except queue.Empty:
+
+            pass
+
+        if serialCon.in_waiting > 0:
+
+            dataStr = serialCon.readline().decode('utf-8').rstrip()
+
+            # Simulated sources report when the line was due
+            readAt[0] = getattr(serialCon, 'lastDueAt', None) or time.time()
+
+            parser.dispatch(dataStr)
+
+        else:
+
+            time.sleep(0.001)
+
+    distanceSeries.close()
+
+
+# Stage 2: batched model inference, rate control and alerts
+def inference_stage(inName, outName, capacity, commandQueue, alertQueue, stopEvent, readyEvent, alertOptions, batchSize=64):
+
+    import flaskServer
+    from anomalyAlerts import AlertDispatcher
+    from telemetryRate import TelemetryRateController
+
+    ringIn = RingBuffer.attach(inName, capacity)
+    ringOut = RingBuffer.attach(outName, capacity)
+
+    rateController = TelemetryRateController(QueuedCommandChannel(commandQueue), probThreshold=0.5, gasThreshold=300.0)
+
+    # Alert settings default to the server's (webhooks, incidents.jsonl, alert_queue)
+    defaults = flaskServer.alertDispatcher
+
+    alertDispatcher = AlertDispatcher(
+
+        alertOptions.get('targets', defaults.targets),
+        incidentFile=alertOptions.get('incidentFile', defaults.incidentFile),
+        queueDir=alertOptions.get('queueDir', defaults.queueDir),
+        quietSeconds=alertOptions.get('quietSeconds', defaults.quietSeconds)
+    ).start()
+
+    # Records already forwarded before a restart are skipped by sequence
+    lastRecord = ringOut.last()
+
+    lastSequence = lastRecord[0] if lastRecord is not None else None
+
+    readyEvent.set()
+
+    while not stopEvent.is_set():
+
+        # Edge alerts forwarded by the ingest stage
+        try:
+
+            while True:
+
+                alertDispatcher.submit(1, alertQueue.get_nowait())
+
+        except queue.Empty:
+
+            pass
+
+        records = ringIn.peek(batchSize)
+
+        if not records:
+
+            time.sleep(0.001)
+
+            continue
+
+        anomalyStatus, probabilities = flaskServer.detect_anomalies([[r[2], r[3], r[4]] for r in records])
+
+        inferredAt = time.time()
+
+        for record, anomaly, probability in zip(records, anomalyStatus, probabilities):
+
+            sequence, ingestTime, temperature, humidity, gas = record[:5]
+
+            rateController.update(probability, gas)
+
+            alertDispatcher.submit(anomaly, {"Temperature": temperature, "Humidity": humidity, "Gas": gas})
+
+            if lastSequence is not None and sequence <= lastSequence:
+
+                continue
+
+            ringOut.put((sequence, ingestTime, temperature, humidity, gas, anomaly, probability, inferredAt), stopEvent)
+
+            lastSequence = sequence
+
+        ringIn.commit(len(records))
+
+
+# Stage 3: storage and HTTP, the Flask app serves the stored readings
+def storage_stage(inName, capacity, stopEvent, readyEvent, options, statusFile):
+
+    import flaskServer
+
+    ring = RingBuffer.attach(inName, capacity)
+
+    flaskServer.csvFile = options.get('csvFile', flaskServer.csvFile)
+
+    # Parser, command and distance state lives in the ingest process
+    status = IngestStatus(statusFile)
+
+    flaskServer.parser = status
+    flaskServer.commandChannel = status
+    flaskServer.distanceSeries = status
+
+    if options.get('serve', True):
+
+        Thread(target=flaskServer.app.run, kwargs={'host': '0.0.0.0', 'port': 5000, 'threaded': True},
+               name='flask-server', daemon=True).start()
+
+    expected = options.get('expected')
+    resultQueue = options.get('resultQueue')
+
+    latencies = []
+    lastSequence = None
+    firstIngest = None
+
+    # Ingest times of records read but not committed yet, oldest first
+    uncommitted = deque()
+
+    readyEvent.set()
+
+    while not stopEvent.is_set():
+
+        records = ring.peek(256, len(uncommitted))
+
+        if not records:
+
+            time.sleep(0.001)
+
+            continue
+
+        for sequence, ingestTime, temperature, humidity, gas, anomaly, probability, inferredAt in records:
+
+            uncommitted.append(ingestTime)
+
+            # Duplicates after an upstream restart
+            if lastSequence is not None and sequence <= lastSequence:
+
+                continue
+
+            lastSequence = sequence
+
+            firstIngest = firstIngest or ingestTime
+
+            gas = int(gas)
+
+            with flaskServer.dataLock:
+
+                flaskServer.latestData.update({"Temperature": temperature, "Humidity": humidity, "Gas": gas, "Anomaly": anomaly})
+
+            # Stamped with the arrival time, not the time storage caught up
+            flaskServer.save_to_csv(temperature, humidity, gas, anomaly, ingestTime)
+
+            latencies.append(time.time() - ingestTime)
+
+        # Committing only records already on disk or covered by stored rows, so a
+        # restarted stage replays the readings the compressor was still holding
+        with flaskServer.csvLock:
+
+            oldestUnstored = flaskServer.compressor.oldest_unstored()
+
+        count = 0
+
+        while uncommitted and (oldestUnstored is None or uncommitted[0] < oldestUnstored):
+
+            uncommitted.popleft()
+
+            count += 1
+
+        ring.commit(count)
+
+        # Benchmark runs end once every reading is stored
+        if expected is not None and len(latencies) >= expected:
+
+            resultQueue.put((latencies, time.time() - firstIngest))
+
+            stopEvent.set()
+
+    flaskServer.flush_csv()
+
+
+# Supervisor: starting the stages and restarting any that crash
+def run_pipeline(capacity=65536, source=None, storageOptions=None, alertOptions=None, keyboard=True):
+
+    source = source or {}
+    storageOptions = storageOptions or {}
+    alertOptions = alertOptions or {}
+
+    context = mp.get_context('spawn')
+
+    ringIngest = RingBuffer.create(capacity)
+    ringInference = RingBuffer.create(capacity)
+
+    commandQueue = context.Queue()
+    alertQueue = context.Queue()
+    stopEvent = context.Event()
+
+    inferenceReady = context.Event()
+    storageReady = context.Event()
+
+    # Ingest state for the routes served by the storage process
+    statusFile = os.path.join(tempfile.gettempdir(), f'ingest_status_{os.getpid()}.json')
+
+    stages = {
+
+        "ingest": (ingest_stage, (ringIngest.name, capacity, commandQueue, alertQueue, stopEvent, [inferenceReady, storageReady], source, statusFile)),
+        "inference": (inference_stage, (ringIngest.name, ringInference.name, capacity, commandQueue, alertQueue, stopEvent, inferenceReady, alertOptions)),
+        "storage": (storage_stage, (ringInference.name, capacity, stopEvent, storageReady, storageOptions, statusFile))
+    }
+
+    processes = {}
+    restarts = {name: 0 for name in stages}
+
+    for name, (target, args) in stages.items():
+
+        processes[name] = context.Process(target=target, args=args, name=name, daemon=True)
+        processes[name].start()
+
+    # Keyboard control stays in the supervisor, commands go through the ingest process
+    if keyboard:
+
+        import flaskServer
+
+        flaskServer.commandChannel = QueuedCommandChannel(commandQueue)
+
+        Thread(target=flaskServer.keyboard_control, name='keyboard', daemon=True).start()
+
+    try:
+
+        while not stopEvent.is_set():
+
+            for name, process in processes.items():
+
+                if process.exitcode is not None and not stopEvent.is_set():
+
+                    restarts[name] += 1
+
+                    print(f"⚠️ Pipeline stage '{name}' exited with code {process.exitcode}, restarting ({restarts[name]})")
+
+                    target, args = stages[name]
+
+                    processes[name] = context.Process(target=target, args=args, name=name, daemon=True)
+                    processes[name].start()
+
+            stopEvent.wait(0.5)
+
+    except KeyboardInterrupt:
+
+        stopEvent.set()
+
+    for process in processes.values():
+
+        process.join(timeout=5)
+
+        if process.is_alive():
+
+            process.terminate()
+
+    ringIngest.close()
+    ringInference.close()
+
+    for path in (statusFile, statusFile + '.tmp'):
+
+        if os.path.exists(path):
+
+            os.remove(path)
+
+    return restarts
+
+
+# Function to summarize latencies (seconds) into milliseconds percentiles
+def summarize(latencies, elapsed):
+
+    latencies = sorted(latencies)
+
+    def percentile(p):
+
+        return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 3)
+
+    return {
+
+        "readings": len(latencies),
+        "throughput_per_s": round(len(latencies) / elapsed, 1),
+        "latency_ms": {"p50": percentile(50), "p95": percentile(95), "p99": percentile(99), "max": percentile(100)}
+    }
+
+
+# Current threaded layout: parse, predict and store on one thread per reading
+def benchmark_threaded(readings, rate, csvFile):
+
+    import flaskServer
+    import serialParser as messages
+    from simulatedSerial import SimulatedSerial
+
+    flaskServer.serialCon = SimulatedSerial(rate=rate, limit=readings)
+    flaskServer.commandChannel.serialCon = flaskServer.serialCon
+    flaskServer.csvFile = csvFile
+    flaskServer.forwardToServer = False
+
+    latencies = []
+
+    handle = flaskServer.handle_telemetry
+
+    def timed(dataDict):
+
+        handle(dataDict)
+
+        latencies.append(time.time() - readAt)
+
+    flaskServer.parser.on(messages.TELEMETRY, timed)
+
+    start = time.time()
+
+    while len(latencies) < readings:
+
+        if flaskServer.serialCon.in_waiting > 0:
+
+            dataStr = flaskServer.serialCon.readline().decode('utf-8').rstrip()
+
+            readAt = flaskServer.serialCon.lastDueAt
+
+            flaskServer.parser.dispatch(dataStr)
+
+    return summarize(latencies, time.time() - start)
+
+
+# Multiprocess layout over the same simulated source
+def benchmark_pipeline(readings, rate, csvFile):
+
+    resultQueue = mp.get_context('spawn').Queue()
+
+    # Simulated anomalies must not reach the real incident log or webhooks
+    alertDir = tempfile.mkdtemp()
+
+    run_pipeline(
+
+        source={'simulated': {'rate': rate, 'limit': readings}, 'distanceFile': os.devnull},
+        storageOptions={'csvFile': csvFile, 'serve': False, 'expected': readings, 'resultQueue': resultQueue},
+        alertOptions={'targets': [], 'incidentFile': os.path.join(alertDir, 'incidents.jsonl'), 'queueDir': os.path.join(alertDir, 'alert_queue')},
+        keyboard=False
+    )
+
+    latencies, elapsed = resultQueue.get(timeout=10)
+
+    return summarize(latencies, elapsed)
+
+
+# Comparing both layouts: unpaced (maximum throughput) and paced (latency)
+def benchmark(readings=20000, pacedRates=(20, 200)):
+
+    results = {}
+
+    workDir = tempfile.mkdtemp()
+
+    scenarios = [("unpaced", 0)] + [(f"paced_{rate}_per_s", rate) for rate in pacedRates]
+
+    for label, rate in scenarios:
+
+        count = readings if rate == 0 else min(readings, rate * 30)
+
+        results[label] = {
+
+            "threaded": benchmark_threaded(count, rate, os.path.join(workDir, f'threaded_{label}.csv')),
+            "pipeline": benchmark_pipeline(count, rate, os.path.join(workDir, f'pipeline_{label}.csv'))
+        }
+
+    return results
+
+
+# Running the pipeline, or the layout benchmark with --benchmark [readings]
+if __name__ == "__main__":
+
+    if '--benchmark' in sys.argv:
+
+        index = sys.argv.index('--benchmark')
+
+        readings = int(sys.argv[index + 1]) if len(sys.argv) > index + 1 else 20000
+
+        print(json.dumps(benchmark(readings), indent=2))
+
+    else:
+
+        run_pipeline()
@@ -0,0 +1,305 @@
+# Importing the required libraries
+import os
+import sys
+import time
+import threading
+import tracemalloc
+from collections import Counter
+from flask import Blueprint, request, Response, abort
+
+
+# Admin routes for profiling the running server in place
+profiler = Blueprint('profiler', __name__, url_prefix='/admin')
+
+# Optional shared secret; without it only local clients are allowed
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+# Upper bound for a single profile, so a forgotten run always ends
+MAX_PROFILE_SECONDS = 300
+
+# tracemalloc accepts 1..65535 frames per traceback
+MAX_TRACE_FRAMES = 65535
+
+# Ways /memory/top can group allocations
+GROUP_BY = ('lineno', 'filename', 'traceback')
+
+
+# Sampling profiler over all threads, collecting collapsed stacks
+class SamplingProfiler:
+
+    def __init__(self):
+
+        self.lock = threading.Lock()
+
+        self.samples = Counter()
+        self.sampleCount = 0
+
+        self.thread = None
+        self.stopEvent = threading.Event()
+
+        self.startedAt = None
+        self.stoppedAt = None
+
+
+    # Starting a time-bounded profile, returns False if one is already running
+    def start(self, seconds, interval):
+
+        with self.lock:
+
+            if self.running():
+
+                return False
+
+            self.samples = Counter()
+            self.sampleCount = 0
+
+            self.stopEvent.clear()
+
+            self.startedAt = time.time()
+            self.stoppedAt = None
+
+            self.thread = threading.Thread(target=self._run, args=(seconds, interval), name='profiler', daemon=True)
+            self.thread.start()
+
+            return True
+
+
+    def stop(self):
+
+        self.stopEvent.set()
+
+        if self.thread is not None:
+
+            self.thread.join()
+
+
+    def running(self):
+
+        return self.thread is not None and self.thread.is_alive()
+
+
+    # Sampling loop: one stack per thread every interval seconds
+    def _run(self, seconds, interval):
+
+        deadline = time.time() + seconds
+
+        ownId = threading.get_ident()
+
+        while time.time() < deadline and not self.stopEvent.is_set():
+
+            names = {t.ident: t.name for t in threading.enumerate()}
+
+            for threadId, frame in sys._current_frames().items():
+
+                if threadId == ownId:
+
+                    continue
+
+                self.samples[self._collapse(names.get(threadId, str(threadId)), frame)] += 1
+
+            self.sampleCount += 1
+
+            # Never waiting past the deadline
+            self.stopEvent.wait(min(interval, deadline - time.time()))
+
+        self.stoppedAt = time.time()
+
+
+    # Collapsed stack format: "thread;outer (file:line);...;inner (file:line)"
+    @staticmethod
+    def _collapse(threadName, frame):
+
+        stack = []
+
+        while frame is not None:
+
+            code = frame.f_code
+
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+
+            frame = frame.f_back
+
+        return ';'.join([threadName] + stack[::-1])
+
+
+    # Collapsed stacks, one "stack count" per line (flamegraph.pl / speedscope input)
+    def collapsed(self):
+
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+sampler = SamplingProfiler()
+
+# Previous tracemalloc snapshot, for growth between dumps
+lastSnapshot = None
+
+
+# Restricting admin routes to local clients or the configured token
+@profiler.before_request
+def check_admin():
+
+    if ADMIN_TOKEN:
+
+        if request.headers.get('X-Admin-Token') != ADMIN_TOKEN:
+
+            abort(403)
+
+    elif request.remote_addr not in ('127.0.0.1', '::1'):
+
+        abort(403)
+
+
+# Function to read a positive numeric query parameter, raising ValueError otherwise
+def positive_arg(name, default, cast=float):
+
+    try:
+
+        value = cast(request.args.get(name, default))
+
+    except ValueError:
+
+        raise ValueError(f"'{name}' must be {'an integer' if cast is int else 'a number'}") from None
+
+    # Also rejecting NaN
+    if not value > 0:
+
+        raise ValueError(f"'{name}' must be positive")
+
+    return value
+
+
+# Starting a sampling profile, e.g. /admin/profile/start?seconds=30&interval=0.01
+@profiler.route('/profile/start', methods=['POST'])
+def start_profile():
+
+    try:
+
+        seconds = min(positive_arg('seconds', 30), MAX_PROFILE_SECONDS)
+        # At least one sample per profile, and no wait past `seconds`
+        interval = min(max(positive_arg('interval', 0.01), 0.001), seconds)
+
+    except ValueError as error:
+
+        return {"message": str(error)}, 400
+
+    if not sampler.start(seconds, interval):
+
+        return {"message": "Profile already running"}, 409
+
+    return {"message": "Profile started", "seconds": seconds, "interval": interval}
+
+
+# Stopping the profile early
+@profiler.route('/profile/stop', methods=['POST'])
+def stop_profile():
+
+    sampler.stop()
+
+    return {"message": "Profile stopped", "samples": sampler.sampleCount}
+
+
+# Returning the collapsed stacks as a flame-graph-compatible file
+@profiler.route('/profile/result')
+def profile_result():
+
+    if sampler.running():
+
+        return {"message": "Profile still running"}, 409
+
+    if sampler.startedAt is None:
+
+        return {"message": "No profile recorded yet"}, 404
+
+    fileName = f"profile_{time.strftime('%Y%m%d_%H%M%S', time.localtime(sampler.startedAt))}.collapsed"
+
+    return Response(
+
+        sampler.collapsed(),
+        mimetype='text/plain',
+        headers={"Content-Disposition": f"attachment; filename={fileName}"}
+    )
+
+
+# Starting tracemalloc, e.g. /admin/memory/start?frames=10
+@profiler.route('/memory/start', methods=['POST'])
+def start_memory():
+
+    global lastSnapshot
+
+    try:
+
+        frames = min(positive_arg('frames', 10, int), MAX_TRACE_FRAMES)
+
+    except ValueError as error:
+
+        return {"message": str(error)}, 400
+
+    if not tracemalloc.is_tracing():
+
+        tracemalloc.start(frames)
+
+        lastSnapshot = None
+
+    return {"message": "tracemalloc tracing"}
+
+
+@profiler.route('/memory/stop', methods=['POST'])
+def stop_memory():
+
+    global lastSnapshot
+
+    tracemalloc.stop()
+
+    lastSnapshot = None
+
+    return {"message": "tracemalloc stopped"}
+
+
+# Top allocations, plus growth since the previous dump, e.g. /admin/memory/top?limit=20
+@profiler.route('/memory/top')
+def memory_top():
+
+    global lastSnapshot
+
+    if not tracemalloc.is_tracing():
+
+        return {"message": "tracemalloc not started, POST /admin/memory/start first"}, 409
+
+    try:
+
+        limit = positive_arg('limit', 20, int)
+
+    except ValueError as error:
+
+        return {"message": str(error)}, 400
+
+    groupBy = request.args.get('group', 'lineno')
+
+    if groupBy not in GROUP_BY:
+
+        return {"message": f"'group' must be one of {', '.join(GROUP_BY)}"}, 400
+
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>")
+    ])
+
+    current, peak = tracemalloc.get_traced_memory()
+
+    result = {
+
+        "current_bytes": current,
+        "peak_bytes": peak,
+        "top": [{"trace": str(stat.traceback), "size": stat.size, "count": stat.count}
+                for stat in snapshot.statistics(groupBy)[:limit]]
+    }
+
+    if lastSnapshot is not None:
+
+        result["growth"] = [{"trace": str(stat.traceback), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                            for stat in snapshot.compare_to(lastSnapshot, groupBy)[:limit]]
+
+    lastSnapshot = snapshot
+
+    return result
@@ -0,0 +1,211 @@
+# Importing the required libraries
+import csv
+import json
+import time
+from collections import Counter, deque
+from threading import Lock
+
+
+# Message types sent by the firmware
+TELEMETRY = "telemetry"
+DISTANCE = "distance"
+OBSTACLE = "obstacle"
+SENSOR_TIMEOUT = "sensor_timeout"
+COMMAND_ACK = "command_ack"
+SPEED_ACK = "speed_ack"
+RATE_ACK = "rate_ack"
+MODE_ACK = "mode_ack"
+COMMAND_REJECTED = "command_rejected"
+SPEED_REJECTED = "speed_rejected"
+RATE_REJECTED = "rate_rejected"
+EDGE_ALERT = "edge_alert"
+INFO = "info"
+UNKNOWN = "unknown"
+MALFORMED = "malformed"
+
+# Plain-text prefixes, checked in order before any JSON decoding
+PREFIXES = [
+
+    ("Distance: ", DISTANCE),
+    ("Obstacle detected!", OBSTACLE),
+    ("Ultrasonic Sensor Timeout", SENSOR_TIMEOUT),
+    ("Command received: ", COMMAND_ACK),
+    ("Speed set to: ", SPEED_ACK),
+    ("Rate set to: ", RATE_ACK),
+    ("Mode changed to: ", MODE_ACK),
+    ("Edge anomaly detected!", EDGE_ALERT),
+    ("Invalid command!", COMMAND_REJECTED),
+    ("Invalid speed!", SPEED_REJECTED),
+    ("Invalid rate!", RATE_REJECTED),
+    ("Invalid ", INFO),
+    ("⚠️", INFO),
+    ("Bluetooth connection Ready!", INFO)
+]
+
+
+# Dispatching parser for the serial stream: one handler per message type
+class SerialMessageParser:
+
+    def __init__(self):
+
+        self.handlers = {}
+
+        self.counters = Counter()
+
+        self.startedAt = time.time()
+
+
+    # Registering the handler for a message type, handler(payload)
+    def on(self, messageType, handler):
+
+        self.handlers[messageType] = handler
+
+        return self
+
+
+    # Classifying a line, returns (message type, payload)
+    def parse(self, line):
+
+        # Telemetry is the only JSON message, so only "{" lines are decoded
+        if line.startswith('{'):
+
+            try:
+
+                return TELEMETRY, json.loads(line)
+
+            except json.JSONDecodeError:
+
+                return MALFORMED, line
+
+        for prefix, messageType in PREFIXES:
+
+            if line.startswith(prefix):
+
+                return messageType, line[len(prefix):].strip()
+
+        return UNKNOWN, line
+
+
+    # Parsing a line and routing it to its handler
+    def dispatch(self, line):
+
+        messageType, payload = self.parse(line)
+
+        self.counters[messageType] += 1
+
+        handler = self.handlers.get(messageType)
+
+        if handler is not None:
+
+            handler(payload)
+
+        return messageType
+
+
+    # Per-type counters, with rates since the parser started
+    def report(self):
+
+        elapsed = max(time.time() - self.startedAt, 1e-9)
+
+        return {
+
+            "elapsed_seconds": round(elapsed, 1),
+            "total": sum(self.counters.values()),
+            "types": {messageType: {"count": count, "per_second": round(count / elapsed, 3)}
+                      for messageType, count in self.counters.most_common()}
+        }
+
+
+# Timestamp format shared with sensorData.csv
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+# Ultrasonic distance as a time series: recent readings in memory, all readings on disk
+class DistanceSeries:
+
+    def __init__(self, csvFile='distanceData.csv', recent=1000, flushSeconds=1.0):
+
+        self.csvFile = csvFile
+
+        self.recent = deque(maxlen=recent)
+
+        self.lock = Lock()
+
+        # Appending through one open file, flushed at most every flushSeconds
+        self.file = None
+        self.writer = None
+        self.flushSeconds = flushSeconds
+        self.lastFlush = 0.0
+
+
+    # Handler for DISTANCE payloads ("N" in cm)
+    def record(self, payload, timeStamp=None):
+
+        try:
+
+            distance = int(payload)
+
+        except ValueError:
+
+            return
+
+        timeStamp = timeStamp or time.time()
+
+        formatted = time.strftime(TIMESTAMP_FORMAT, time.localtime(timeStamp))
+
+        with self.lock:
+
+            self.recent.append((formatted, distance))
+
+            if self.file is None:
+
+                self._open()
+
+            self.writer.writerow([formatted, distance])
+
+            if timeStamp - self.lastFlush >= self.flushSeconds:
+
+                self.file.flush()
+
+                self.lastFlush = timeStamp
+
+
+    def _open(self):
+
+        try:
+
+            fileExists = open(self.csvFile).readline() != ''
+
+        except FileNotFoundError:
+
+            fileExists = False
+
+        self.file = open(self.csvFile, mode='a', newline='')
+        self.writer = csv.writer(self.file)
+
+        if not fileExists:
+
+            self.writer.writerow(["Timestamp", "Distance"])
+
+
+    # Most recent (timestamp, distance) readings, oldest first
+    def latest(self, count=100):
+
+        if count <= 0:
+
+            return []
+
+        with self.lock:
+
+            return list(self.recent)[-count:]
+
+
+    def close(self):
+
+        with self.lock:
+
+            if self.file is not None:
+
+                self.file.close()
+
+                self.file = None
@@ -0,0 +1,90 @@
+# Importing the required libraries
+import json
+import time
+import random
+
+
+# Stand-in for serial.Serial that produces firmware-like lines, for benchmarks
+# rate: telemetry lines per second (0 = as fast as possible)
+# limit: number of telemetry lines before the source runs dry (None = endless)
+class SimulatedSerial:
+
+    def __init__(self, rate=0.0, limit=None, distanceEvery=0, anomalyEvery=50, seed=42):
+
+        self.rate = rate
+        self.limit = limit
+
+        # Interleaving "Distance: N" lines as in autonomous mode
+        self.distanceEvery = distanceEvery
+
+        # One anomalous reading every anomalyEvery readings
+        self.anomalyEvery = anomalyEvery
+
+        self.random = random.Random(seed)
+
+        self.sent = 0
+        self.lines = 0
+        self.nextAt = time.time()
+
+        self.written = []
+
+        self.lastDueAt = None
+
+
+    @property
+    def in_waiting(self):
+
+        if self.limit is not None and self.sent >= self.limit:
+
+            return 0
+
+        return 1 if time.time() >= self.nextAt else 0
+
+
+    # Returning the next line, blocking until it is due like a real port
+    def readline(self):
+
+        wait = self.nextAt - time.time()
+
+        if wait > 0:
+
+            time.sleep(wait)
+
+        # When the line was due, so benchmarks count time spent waiting to be read
+        self.lastDueAt = self.nextAt if self.rate else time.time()
+
+        self.lines += 1
+
+        if self.distanceEvery and self.lines % (self.distanceEvery + 1) == 0:
+
+            return f"Distance: {self.random.randint(5, 400)}\r\n".encode()
+
+        self.sent += 1
+
+        if self.rate:
+
+            self.nextAt += 1.0 / self.rate
+
+        return (json.dumps(self.reading()) + "\r\n").encode()
+
+
+    # One DHT11 / gas sensor reading, as sent by sendSensorData()
+    def reading(self):
+
+        if self.anomalyEvery and self.sent % self.anomalyEvery == 0:
+
+            return {"Temperature": float(self.random.randint(40, 60)),
+                    "Humidity": float(self.random.randint(10, 30)),
+                    "Gas": self.random.randint(300, 1000)}
+
+        return {"Temperature": float(self.random.randint(20, 30)),
+                "Humidity": float(self.random.randint(40, 70)),
+                "Gas": self.random.randint(0, 120)}
+
+
+    # Commands from the host are recorded, not acted on
+    def write(self, data):
+
+        self.written.append(data)
+
+        return len(data)
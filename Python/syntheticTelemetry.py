@@ -0,0 +1,263 @@
+# Importing the required libraries
+import os
+import math
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import multiprocessing as mp
+from collections import deque
+from outOfCoreTraining import RECORD_DTYPE
+
+
+# Output columns, same schema as sensorData.csv
+COLUMNS = ["Timestamp", "Temperature", "Humidity", "Gas", "Anomaly"]
+
+# Text of every integer a reading can take (gas is a 10-bit analogRead)
+INTEGER_TEXT = np.array([str(value).encode() for value in range(1024)])
+
+# Episode kinds: (share of episodes, temperature rise, humidity drop, gas rise) ranges
+EPISODES = {
+
+    "fire": (0.4, (15.0, 35.0), (25.0, 40.0), (400.0, 900.0)),
+    "smoke": (0.6, (2.0, 8.0), (5.0, 15.0), (250.0, 700.0))
+}
+
+# Episode timing (seconds): active duration, rise and decay time constants
+EPISODE_DURATION = (120.0, 1200.0)
+RISE_TIME = (30.0, 180.0)
+DECAY_TIME = (60.0, 300.0)
+
+# An episode is labeled anomalous while its intensity is above this share of the peak
+LABEL_INTENSITY = 0.3
+
+# Seconds between readings, as logged by the car
+DEFAULT_INTERVAL = 2.0
+
+
+# Function to get the smallest chunk (rows) that outlasts the longest episode
+# Episodes may spill into the next chunk only, so a chunk must outlast one
+def min_chunk_rows(interval=DEFAULT_INTERVAL):
+
+    longest = EPISODE_DURATION[1] + 5 * DECAY_TIME[1]
+
+    return math.ceil(longest / interval)
+
+
+# Generation settings shared by every chunk
+class Settings:
+
+    def __init__(self, rows, seed=42, start='2025-01-01 00:00:00', interval=DEFAULT_INTERVAL,
+                 chunkRows=1000000, episodesPerDay=0.5):
+
+        self.rows = rows
+        self.seed = seed
+        self.start = int(pd.Timestamp(start).timestamp())
+        self.interval = interval
+        self.chunkRows = chunkRows
+        self.episodesPerDay = episodesPerDay
+
+        self.chunks = (rows + chunkRows - 1) // chunkRows
+
+        if chunkRows < min_chunk_rows(interval):
+
+            raise ValueError(f"chunkRows must be at least {min_chunk_rows(interval)} at a {interval} s interval")
+
+
+# Function to draw the episodes that start inside one chunk
+# Each chunk has its own random stream, so results do not depend on worker count
+def chunk_episodes(settings, chunkIndex):
+
+    if chunkIndex < 0:
+
+        return []
+
+    generator = np.random.default_rng([settings.seed, chunkIndex, 1])
+
+    chunkStart = settings.start + chunkIndex * settings.chunkRows * settings.interval
+    chunkSpan = settings.chunkRows * settings.interval
+
+    count = generator.poisson(settings.episodesPerDay * chunkSpan / 86400.0)
+
+    episodes = []
+
+    for _ in range(count):
+
+        kind = "fire" if generator.random() < EPISODES["fire"][0] else "smoke"
+
+        _, temperatureRise, humidityDrop, gasRise = EPISODES[kind]
+
+        episodes.append({
+
+            "start": chunkStart + generator.uniform(0, chunkSpan),
+            "duration": generator.uniform(*EPISODE_DURATION),
+            "rise": generator.uniform(*RISE_TIME),
+            "decay": generator.uniform(*DECAY_TIME),
+            "temperature": generator.uniform(*temperatureRise),
+            "humidity": generator.uniform(*humidityDrop),
+            "gas": generator.uniform(*gasRise)
+        })
+
+    return episodes
+
+
+# Function to generate one chunk of readings as column arrays
+def generate_chunk(settings, chunkIndex):
+
+    first = chunkIndex * settings.chunkRows
+    count = min(settings.chunkRows, settings.rows - first)
+
+    generator = np.random.default_rng([settings.seed, chunkIndex, 0])
+
+    seconds = settings.start + (first + np.arange(count, dtype=np.int64)) * settings.interval
+
+    # Diurnal cycle (warmest mid-afternoon) plus a slow weekly drift
+    hours = (seconds % 86400) / 3600.0
+
+    diurnal = np.sin(2 * np.pi * (hours - 9.0) / 24.0)
+    weekly = np.sin(2 * np.pi * seconds / (7 * 86400.0))
+
+    temperature = 24.0 + 3.0 * diurnal + 1.5 * weekly + generator.normal(0, 0.4, count)
+    humidity = 55.0 - 8.0 * diurnal - 3.0 * weekly + generator.normal(0, 1.5, count)
+
+    # Gas sensor: baseline drift, smoothed noise and rare spikes
+    noise = generator.normal(0, 6.0, count + 4)
+
+    smoothed = (noise[:-4] + noise[1:-3] + noise[2:-2] + noise[3:-1] + noise[4:]) / np.sqrt(5)
+
+    spikes = np.where(generator.random(count) < 0.001, generator.exponential(40.0, count), 0.0)
+
+    gas = 50.0 + 15.0 * weekly + 5.0 * diurnal + smoothed + spikes
+
+    anomaly = np.zeros(count, dtype=np.int16)
+
+    # Episodes from this chunk and from the previous one (which may spill over)
+    for episode in chunk_episodes(settings, chunkIndex - 1) + chunk_episodes(settings, chunkIndex):
+
+        elapsed = seconds - episode["start"]
+
+        active = (elapsed >= 0) & (elapsed <= episode["duration"] + 5 * episode["decay"])
+
+        if not active.any():
+
+            continue
+
+        tau = elapsed[active]
+
+        # Exponential rise to the peak, then exponential decay after the episode ends
+        peak = 1.0 - np.exp(-np.minimum(tau, episode["duration"]) / episode["rise"])
+
+        intensity = np.where(tau <= episode["duration"], peak, peak * np.exp(-(tau - episode["duration"]) / episode["decay"]))
+
+        temperature[active] += episode["temperature"] * intensity
+        humidity[active] -= episode["humidity"] * intensity
+        gas[active] += episode["gas"] * intensity * (1.0 + generator.normal(0, 0.05, active.sum()))
+
+        anomaly[active] |= (intensity >= LABEL_INTENSITY).astype(np.int16)
+
+    # DHT11 reports whole degrees and percent; the gas sensor is a 10-bit analogRead
+    temperature = np.clip(np.round(temperature), 0, 60).astype(np.float32)
+    humidity = np.clip(np.round(humidity), 5, 95).astype(np.float32)
+    gas = np.clip(np.round(gas), 0, 1023).astype(np.float32)
+
+    return seconds, temperature, humidity, gas, anomaly
+
+
+# Function to encode one chunk in the output format, in the worker process
+def encode_chunk(args):
+
+    settings, chunkIndex, binary = args
+
+    seconds, temperature, humidity, gas, anomaly = generate_chunk(settings, chunkIndex)
+
+    if binary:
+
+        records = np.empty(len(seconds), dtype=RECORD_DTYPE)
+
+        records['Timestamp'] = seconds
+        records['Temperature'] = temperature
+        records['Humidity'] = humidity
+        records['Gas'] = gas
+        records['Anomaly'] = anomaly
+
+        return records.tobytes()
+
+    # 'YYYY-MM-DDTHH:MM:SS' with the 'T' swapped for a space, as written by flaskServer.py
+    timeStamps = np.datetime_as_string(seconds.astype('datetime64[s]'), unit='s').astype('S19')
+
+    timeStamps.view('S1').reshape(-1, 19)[:, 10] = b' '
+
+    # Every value is a whole number in 0..1023, so rows are assembled from a lookup table
+    rows = timeStamps
+
+    for column in (temperature, humidity, gas, anomaly):
+
+        rows = np.char.add(np.char.add(rows, b','), INTEGER_TEXT[column.astype(np.int16)])
+
+    header = (','.join(COLUMNS) + '\n').encode() if chunkIndex == 0 else b''
+
+    return header + b''.join(np.char.add(rows, b'\n').tolist())
+
+
+# Function to write the dataset, generating chunks on several cores
+# Chunks are written in order and at most 2 per worker are in flight, so memory stays bounded
+def generate(path, settings, workers=None):
+
+    binary = path.endswith('.bin')
+
+    workers = workers or os.cpu_count() or 1
+
+    tasks = ((settings, chunkIndex, binary) for chunkIndex in range(settings.chunks))
+
+    with open(path, 'wb') as file:
+
+        if workers == 1:
+
+            for task in tasks:
+
+                file.write(encode_chunk(task))
+
+            return
+
+        with mp.get_context('spawn').Pool(workers) as pool:
+
+            pending = deque()
+
+            for task in tasks:
+
+                pending.append(pool.apply_async(encode_chunk, (task,)))
+
+                if len(pending) >= 2 * workers:
+
+                    file.write(pending.popleft().get())
+
+            while pending:
+
+                file.write(pending.popleft().get())
+
+
+# Generating a dataset from the command line
+if __name__ == "__main__":
+
+    argParser = argparse.ArgumentParser(description="Synthetic telemetry generator (sensorData.csv schema)")
+
+    argParser.add_argument('--rows', type=int, default=10000000)
+    argParser.add_argument('--output', default='syntheticData.csv', help=".csv, or .bin for the binary export")
+    argParser.add_argument('--seed', type=int, default=42)
+    argParser.add_argument('--start', default='2025-01-01 00:00:00')
+    argParser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="seconds between readings")
+    argParser.add_argument('--chunk-rows', type=int, default=1000000, help="rows per chunk (part of the seed: keep it fixed to reproduce a file)")
+    argParser.add_argument('--episodes-per-day', type=float, default=0.5, help="average fire/smoke episodes per day")
+    argParser.add_argument('--workers', type=int, default=None)
+
+    args = argParser.parse_args()
+
+    settings = Settings(args.rows, args.seed, args.start, args.interval, args.chunk_rows, args.episodes_per_day)
+
+    started = time.time()
+
+    generate(args.output, settings, args.workers)
+
+    elapsed = time.time() - started
+
+    print(f"{args.rows} rows written to {args.output} in {elapsed:.1f} s ({args.rows / elapsed:,.0f} rows/s)")
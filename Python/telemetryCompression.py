@@ -0,0 +1,311 @@
+# Importing the required libraries
+import pandas as pd
+
+
+# Sensor channels that are compressed before storage
+CHANNELS = ["Temperature", "Humidity", "Gas"]
+
+# Default per-channel maximum error (same units as the sensor readings)
+# DHT11 reports whole degrees and percent, so half a unit keeps every real step
+DEFAULT_MAX_ERROR = {"Temperature": 0.5, "Humidity": 1.0, "Gas": 5.0}
+
+# Default heartbeat: a row is always stored at least this often (seconds)
+DEFAULT_MAX_INTERVAL = 60.0
+
+# Supported compression algorithms
+DEADBAND = "deadband"
+SWINGING_DOOR = "swinging_door"
+
+
+# Per-channel swinging-door state, relative to the last archived point
+class SwingingDoor:
+
+    def __init__(self, maxError):
+
+        self.maxError = maxError
+
+        self.reset(None, None)
+
+
+    # Restarting the door from a newly archived point
+    def reset(self, timeStamp, value):
+
+        self.originTime = timeStamp
+        self.originValue = value
+
+        self.upperSlope = float('inf')
+        self.lowerSlope = float('-inf')
+
+        self.closed = False
+
+
+    # Narrowing the door with a new point, returns True if the point can end the
+    # segment: the line from the origin to it stays within every earlier point's band
+    def offer(self, timeStamp, value):
+
+        elapsed = timeStamp - self.originTime
+
+        # Same timestamp as the origin, only the error band applies
+        if elapsed <= 0:
+
+            fits = abs(value - self.originValue) <= self.maxError
+
+            self.closed = self.closed or not fits
+
+            return fits
+
+        # The door holds the slopes that keep every earlier point within its band
+        slope = (value - self.originValue) / elapsed
+
+        fits = self.lowerSlope <= slope <= self.upperSlope
+
+        upper = (value + self.maxError - self.originValue) / elapsed
+        lower = (value - self.maxError - self.originValue) / elapsed
+
+        self.upperSlope = min(self.upperSlope, upper)
+        self.lowerSlope = max(self.lowerSlope, lower)
+
+        self.closed = self.closed or self.lowerSlope > self.upperSlope
+
+        return fits
+
+
+# Row-level compressor: a row is archived when any channel requires it
+class TelemetryCompressor:
+
+    def __init__(self, method=SWINGING_DOOR, maxError=None, maxInterval=DEFAULT_MAX_INTERVAL):
+
+        if method not in (DEADBAND, SWINGING_DOOR):
+
+            raise ValueError(f"Unknown compression method: {method}")
+
+        self.method = method
+        self.maxError = dict(DEFAULT_MAX_ERROR, **(maxError or {}))
+        self.maxInterval = maxInterval
+
+        self.doors = {channel: SwingingDoor(self.maxError[channel]) for channel in CHANNELS}
+
+        # Last archived row, the rows offered since then, and the index of the
+        # latest buffered row that can end the current segment
+        self.lastArchived = None
+        self.buffer = []
+        self.pending = None
+
+        # Counting offered and archived rows, for the compression ratio
+        self.received = 0
+        self.archived = 0
+
+
+    # Offering a new reading, returns the list of rows that must be stored now
+    # Each row is a tuple: (timestamp seconds, {channel: value}, anomaly)
+    def offer(self, timeStamp, values, anomaly):
+
+        self.received += 1
+
+        row = (timeStamp, dict(values), int(anomaly))
+
+        # First reading is always stored
+        if self.lastArchived is None:
+
+            return self._archive([row])
+
+        # Anomalies and anomaly transitions are always stored, with the point before them
+        if anomaly or row[2] != self.lastArchived[2]:
+
+            return self._drain() + self._archive([row])
+
+        # Heartbeat: storing a row at least every maxInterval seconds
+        if timeStamp - self.lastArchived[0] >= self.maxInterval:
+
+            return self._drain() + self._archive([row])
+
+        if self.method == DEADBAND:
+
+            return self._offer_deadband(row)
+
+        return self._offer_swinging_door([row])
+
+
+    # Returning the buffered rows that must be stored, to be called before shutdown
+    def flush(self):
+
+        return self._drain()
+
+
+    # Timestamp of the oldest offered row that is neither stored nor known to be
+    # covered yet, None if there is none; rows from then on only exist in memory
+    def oldest_unstored(self):
+
+        return self.buffer[0][0] if self.buffer else None
+
+
+    # Ratio between received and stored rows
+    def ratio(self):
+
+        return self.received / self.archived if self.archived else 1.0
+
+
+    # Deadband: storing a row once any channel moves beyond its maximum error
+    def _offer_deadband(self, row):
+
+        for channel in CHANNELS:
+
+            if abs(row[1][channel] - self.lastArchived[1][channel]) > self.maxError[channel]:
+
+                return self._archive([row])
+
+        return []
+
+
+    # Swinging door: when any door closes, storing the latest buffered row that can
+    # end the segment and replaying the rows after it from there
+    def _offer_swinging_door(self, rows):
+
+        stored = []
+
+        rows = list(rows)
+
+        while rows:
+
+            row = rows.pop(0)
+
+            fits = all([self.doors[channel].offer(row[0], row[1][channel]) for channel in CHANNELS])
+
+            if not any(self.doors[channel].closed for channel in CHANNELS):
+
+                if fits:
+
+                    self.pending = len(self.buffer)
+
+                self.buffer.append(row)
+
+                continue
+
+            # Closed on the first row after an archive (same timestamp, outside the band)
+            if self.pending is None:
+
+                stored += self._archive([row])
+
+                continue
+
+            replay = self.buffer[self.pending + 1:]
+
+            stored += self._archive([self.buffer[self.pending]])
+
+            rows = replay + [row] + rows
+
+        return stored
+
+
+    # Storing buffered rows until every one of them is covered, before a forced row
+    def _drain(self):
+
+        stored = []
+
+        while self.buffer:
+
+            replay = self.buffer[self.pending + 1:]
+
+            stored += self._archive([self.buffer[self.pending]])
+
+            stored += self._offer_swinging_door(replay)
+
+        return stored
+
+
+    # Marking rows as stored and restarting the doors from the last one
+    def _archive(self, rows):
+
+        if not rows:
+
+            return []
+
+        self.archived += len(rows)
+
+        self.lastArchived = rows[-1]
+
+        self.buffer = []
+        self.pending = None
+
+        for channel in CHANNELS:
+
+            self.doors[channel].reset(self.lastArchived[0], self.lastArchived[1][channel])
+
+        return rows
+
+
+# Function to rebuild an evenly sampled series from a compressed CSV/DataFrame
+# Deadband data is held (step), swinging-door data is linearly interpolated
+# The heartbeat stores a row at least every maxInterval, so a longer gap means no
+# data was received: the series is split there and each segment is resampled alone
+def reconstruct_series(dataset, freq='2s', method=SWINGING_DOOR, maxGap=DEFAULT_MAX_INTERVAL):
+
+    dataset = dataset.copy()
+
+    # Removing spaces
+    dataset.columns = dataset.columns.str.strip()
+
+    dataset['Timestamp'] = pd.to_datetime(dataset['Timestamp'])
+
+    dataset = dataset.drop_duplicates(subset='Timestamp').set_index('Timestamp').sort_index()
+
+    # Numbering the segments between gaps longer than maxGap
+    segments = (dataset.index.to_series().diff() > pd.Timedelta(seconds=maxGap)).cumsum()
+
+    return pd.concat([_resample(segment, freq, method) for _, segment in dataset.groupby(segments)], ignore_index=True)
+
+
+# Function to resample one gap-free segment onto a grid starting at its first row
+def _resample(segment, freq, method):
+
+    grid = pd.date_range(segment.index[0], segment.index[-1], freq=freq)
+
+    series = segment.reindex(segment.index.union(grid))
+
+    if method == DEADBAND:
+
+        series[CHANNELS] = series[CHANNELS].ffill()
+
+    else:
+
+        series[CHANNELS] = series[CHANNELS].interpolate(method='time')
+
+    # The anomaly label is a state, so it is always held
+    series['Anomaly'] = series['Anomaly'].ffill().astype(int)
+
+    return series.loc[grid].rename_axis('Timestamp').reset_index()
+
+
+# Function to load a compressed CSV and reconstruct it, for the training scripts
+def load_reconstructed(csvFile, freq='2s', method=SWINGING_DOOR, maxGap=DEFAULT_MAX_INTERVAL):
+
+    return reconstruct_series(pd.read_csv(csvFile), freq=freq, method=method, maxGap=maxGap)
+
+
+# Compressing an existing CSV file and reporting the achieved ratio
+if __name__ == "__main__":
+
+    import sys
+
+    source = sys.argv[1] if len(sys.argv) > 1 else 'sensorData.csv'
+    method = sys.argv[2] if len(sys.argv) > 2 else SWINGING_DOOR
+
+    dataset = pd.read_csv(source)
+    dataset.columns = dataset.columns.str.strip()
+
+    timeStamps = pd.to_datetime(dataset['Timestamp']).astype('int64') / 1e9
+
+    compressor = TelemetryCompressor(method=method)
+
+    stored = []
+
+    for timeStamp, (_, reading) in zip(timeStamps, dataset.iterrows()):
+
+        stored += compressor.offer(timeStamp, reading[CHANNELS].to_dict(), reading['Anomaly'])
+
+    stored += compressor.flush()
+
+    print(f"Method: {method}")
+    print(f"Received rows: {compressor.received}")
+    print(f"Stored rows: {len(stored)}")
+    print(f"Compression ratio: {compressor.ratio():.2f}x")
@@ -0,0 +1,118 @@
+# Importing the required libraries
+import time
+from collections import deque
+
+
+# Reporting intervals (ms) the controller chooses from, from calm to dangerous
+# Each level applies once the risk score reaches its lower bound
+RATE_LEVELS = [(0.0, 10000), (0.3, 5000), (0.6, 2000), (1.0, 1000)]
+
+# Firmware limits for the "rateNNN" command (the DHT11 needs 1 s between reads)
+MIN_RATE_MS = 1000
+MAX_RATE_MS = 60000
+
+
+# Adaptive telemetry rate, driven by the anomaly probability and the gas trend
+class TelemetryRateController:
+
+    def __init__(self, commandChannel, probThreshold=0.5, gasThreshold=300.0,
+                 horizon=30.0, window=10, holdSeconds=60.0, levels=RATE_LEVELS):
+
+        self.commandChannel = commandChannel
+
+        # Risk reaches 1.0 when either signal reaches its threshold
+        self.probThreshold = probThreshold
+        self.gasThreshold = gasThreshold
+
+        # Gas trend is projected this many seconds ahead
+        self.horizon = horizon
+
+        # Recent (time, gas) pairs for the trend
+        self.gasHistory = deque(maxlen=window)
+
+        # Slowing down only after the risk has stayed low this long
+        self.holdSeconds = holdSeconds
+
+        self.levels = sorted(levels)
+
+        self.currentRate = None
+        self.lastRisky = 0.0
+
+
+    # Gas slope in units per second, least squares over the recent window
+    def gas_trend(self):
+
+        if len(self.gasHistory) < 2:
+
+            return 0.0
+
+        times = [t for t, _ in self.gasHistory]
+        values = [g for _, g in self.gasHistory]
+
+        meanTime = sum(times) / len(times)
+        meanValue = sum(values) / len(values)
+
+        variance = sum((t - meanTime) ** 2 for t in times)
+
+        if variance == 0:
+
+            return 0.0
+
+        return sum((t - meanTime) * (g - meanValue) for t, g in self.gasHistory) / variance
+
+
+    # Combining the model probability and the projected gas into one score
+    def risk(self, probability, gas):
+
+        projectedGas = gas + max(self.gas_trend(), 0.0) * self.horizon
+
+        return max(probability / self.probThreshold, projectedGas / self.gasThreshold)
+
+
+    # Picking the reporting interval for a risk score
+    def rate_for(self, risk):
+
+        rate = self.levels[0][1]
+
+        for lowerBound, levelRate in self.levels:
+
+            if risk >= lowerBound:
+
+                rate = levelRate
+
+        return min(max(rate, MIN_RATE_MS), MAX_RATE_MS)
+
+
+    # Updating with a new reading, sending "rateNNN" when the interval changes
+    def update(self, probability, gas, now=None):
+
+        now = time.time() if now is None else now
+
+        self.gasHistory.append((now, gas))
+
+        targetRate = self.rate_for(self.risk(probability, gas))
+
+        # Faster (or unchanged) sampling is applied right away and restarts the hold
+        if self.currentRate is None or targetRate <= self.currentRate:
+
+            self.lastRisky = now
+
+            return self._apply(targetRate)
+
+        # Slower sampling waits until readings have been calm for a while
+        if now - self.lastRisky >= self.holdSeconds:
+
+            return self._apply(targetRate)
+
+        return self.currentRate
+
+
+    def _apply(self, rate):
+
+        if rate != self.currentRate:
+
+            self.commandChannel.send(f"rate{rate}")
+
+            self.currentRate = rate
+
+        return rate
@@ -0,0 +1,7 @@
+# Importing the required libraries
+import os
+import sys
+
+
+# The scripts import each other by module name, as when run from the Python folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,155 @@
+# Importing the required libraries
+import os
+import time
+import pytest
+from anomalyAlerts import AlertDispatcher, run_test_receiver
+
+
+READING = {"Temperature": 45.0, "Humidity": 15.0, "Gas": 600}
+
+
+@pytest.fixture
+def receiver():
+
+    servers = []
+
+    # Starting a local stand-in on a free port, failing its first requests
+    def start(failFirst=0):
+
+        server, received = run_test_receiver(port=0, failFirst=failFirst)
+
+        servers.append(server)
+
+        return f"http://127.0.0.1:{server.server_port}/alert", received
+
+    yield start
+
+    for server in servers:
+
+        server.shutdown()
+
+
+@pytest.fixture
+def dispatchers(tmp_path):
+
+    started = []
+
+    def start(target, **options):
+
+        dispatcher = AlertDispatcher(
+
+            [target],
+            incidentFile=str(tmp_path / 'incidents.jsonl'),
+            queueDir=str(tmp_path / 'alert_queue'),
+            **options
+        ).start()
+
+        started.append(dispatcher)
+
+        return dispatcher
+
+    yield start
+
+    for dispatcher in started:
+
+        dispatcher.stop()
+
+
+# Function to wait until a condition holds, or fail after a timeout
+def wait_for(condition, timeout=10.0):
+
+    deadline = time.time() + timeout
+
+    while time.time() < deadline:
+
+        if condition():
+
+            return
+
+        time.sleep(0.05)
+
+    pytest.fail("Timed out")
+
+
+# Anomalies close together form one incident: one open and one close event
+def test_anomalies_are_debounced_into_one_incident(receiver, dispatchers):
+
+    target, received = receiver()
+
+    dispatcher = dispatchers(target, quietSeconds=0.5)
+
+    for anomaly in [0, 1, 1, 1, 0, 1, 0, 0]:
+
+        dispatcher.submit(anomaly, READING)
+
+    wait_for(lambda: len(received) >= 2)
+
+    # No further events once the incident closed
+    time.sleep(0.5)
+
+    assert [event["event"] for event in received] == ["incident_opened", "incident_closed"]
+
+    assert received[1]["count"] == 4
+    assert dispatcher.stats["incidents"] == 1
+
+
+# Failed deliveries are retried with backoff until the receiver accepts them
+def test_failed_deliveries_are_retried(receiver, dispatchers):
+
+    target, received = receiver(failFirst=3)
+
+    dispatcher = dispatchers(target, quietSeconds=0.2, baseDelay=0.05, workers=1)
+
+    dispatcher.submit(1, READING)
+
+    wait_for(lambda: dispatcher.stats["delivered"] == 2)
+
+    assert dispatcher.stats["retried"] == 3
+    assert [event["event"] for event in received if event] == ["incident_opened", "incident_closed"]
+
+    # Delivered entries leave the queue
+    assert os.listdir(dispatcher.queueDir) == []
+
+
+# Deliveries that keep failing are dropped after maxRetries
+def test_deliveries_give_up_after_max_retries(receiver, dispatchers):
+
+    target, received = receiver(failFirst=10 ** 6)
+
+    dispatcher = dispatchers(target, quietSeconds=0.2, baseDelay=0.01, maxRetries=2, workers=1)
+
+    dispatcher.submit(1, READING)
+
+    wait_for(lambda: dispatcher.stats["failed"] == 2)
+
+    assert len(received) == 2 * 3
+
+
+# The on-disk queue never holds more than maxQueued deliveries, even while retrying
+def test_queue_is_bounded(receiver, dispatchers):
+
+    target, received = receiver(failFirst=10 ** 6)
+
+    # Every anomaly is its own incident: one open and one close delivery each
+    dispatcher = dispatchers(target, quietSeconds=0.0, maxQueued=3, baseDelay=0.001, maxDelay=0.01, workers=4)
+
+    largest = 0
+
+    for _ in range(40):
+
+        dispatcher.submit(1, READING)
+
+        largest = max(largest, len([f for f in os.listdir(dispatcher.queueDir) if f.endswith('.json')]))
+
+        time.sleep(0.01)
+
+    wait_for(lambda: dispatcher.stats["incidents"] == 40)
+
+    for _ in range(50):
+
+        largest = max(largest, len([f for f in os.listdir(dispatcher.queueDir) if f.endswith('.json')]))
+
+        time.sleep(0.01)
+
+    assert largest <= 3
+    assert dispatcher.stats["dropped"] > 0
@@ -0,0 +1,55 @@
+# Importing the required libraries
+import commandChannel as commands
+from commandChannel import CommandChannel
+
+
+# Serial stand-in recording what is written
+class FakeSerial:
+
+    def __init__(self):
+
+        self.written = []
+
+    def write(self, data):
+
+        self.written.append(data)
+
+
+def test_ack_clears_pending():
+
+    channel = CommandChannel(FakeSerial())
+
+    channel.send("speed150")
+
+    assert commands.SPEED in channel.unacknowledged()
+
+    channel.acknowledge(commands.SPEED, "150")
+
+    assert channel.unacknowledged() == {}
+    assert channel.acked[commands.SPEED]["value"] == "150"
+
+
+# A refused command is no longer pending and is reported as rejected
+def test_reject_clears_pending():
+
+    channel = CommandChannel(FakeSerial())
+
+    channel.send("rate100")
+
+    channel.reject(commands.RATE, "Must be between 1000 and 60000.")
+
+    assert channel.unacknowledged() == {}
+    assert channel.rejected[commands.RATE]["value"] == "100"
+
+
+# Move commands are acked before being validated
+def test_reject_after_move_ack():
+
+    channel = CommandChannel(FakeSerial())
+
+    channel.send("x")
+
+    channel.acknowledge(commands.MOVE, "x")
+    channel.reject(commands.MOVE, "Try again.")
+
+    assert channel.rejected[commands.MOVE]["value"] == "x"
@@ -0,0 +1,103 @@
+# Importing the required libraries
+import pytest
+from csvIndex import CsvTimeIndex
+
+
+HEADER = "Timestamp,Temperature,Humidity,Gas,Anomaly\n"
+
+
+# Function to append rows through the index, like flaskServer.write_rows
+def write(index, csvFile, timeStamps):
+
+    with open(csvFile, 'a') as file:
+
+        if file.tell() == 0:
+
+            index.reset()
+
+            file.write(HEADER)
+
+        for number, timeStamp in enumerate(timeStamps):
+
+            index.note(timeStamp, file.tell())
+
+            file.write(f"{timeStamp},20,50,{number},0\n")
+
+
+# Function to run a range query and return the data rows
+def query(index, start, end):
+
+    lines = b''.join(index.iter_range(start, end)).decode().splitlines()
+
+    assert lines[0] + "\n" == HEADER
+
+    return lines[1:]
+
+
+# Two rows per second, with an entry every 3 rows
+@pytest.fixture
+def indexed(tmp_path):
+
+    csvFile = str(tmp_path / 'sensorData.csv')
+
+    timeStamps = [f"2025-01-01 00:00:{second:02d}" for second in range(20) for _ in range(2)]
+
+    index = CsvTimeIndex(csvFile, everyRows=3, everySeconds=600)
+
+    write(index, csvFile, timeStamps)
+
+    return index, csvFile, timeStamps
+
+
+# Every range returns exactly the rows a full scan would
+def test_ranges_match_full_scan(indexed):
+
+    index, csvFile, timeStamps = indexed
+
+    rows = open(csvFile).read().splitlines()[1:]
+
+    for first in range(20):
+
+        for last in range(first, 20):
+
+            start, end = f"2025-01-01 00:00:{first:02d}", f"2025-01-01 00:00:{last:02d}"
+
+            assert query(index, start, end) == [row for row in rows if start <= row[:19] <= end]
+
+
+# An entry stamped with `start` must not hide rows of the same second before it
+def test_start_on_entry_second(indexed):
+
+    index, csvFile, timeStamps = indexed
+
+    # Row 3 (the second row of 00:00:01) starts an index entry
+    assert "2025-01-01 00:00:01" in index.timeStamps
+
+    assert len(query(index, "2025-01-01 00:00:01", "2025-01-01 00:00:01")) == 2
+
+
+def test_open_bounds(indexed):
+
+    index, csvFile, timeStamps = indexed
+
+    assert len(query(index, None, None)) == 40
+    assert len(query(index, "2025-01-01 00:00:18", None)) == 4
+    assert len(query(index, None, "2025-01-01 00:00:00")) == 2
+    assert query(index, "2025-01-02 00:00:00", None) == []
+
+
+# A missing or stale sidecar is rebuilt from the CSV
+def test_rebuild(indexed):
+
+    index, csvFile, timeStamps = indexed
+
+    with open(index.indexFile, 'w') as file:
+
+        file.write("2025-01-01 00:00:05,1\n")
+
+    rebuilt = CsvTimeIndex(csvFile, everyRows=3, everySeconds=600)
+
+    rebuilt.load()
+
+    assert rebuilt.timeStamps == index.timeStamps
+    assert rebuilt.offsets == index.offsets
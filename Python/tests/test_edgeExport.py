@@ -0,0 +1,30 @@
+# Importing the required libraries
+import os
+import numpy as np
+from joblib import load
+from sklearn.ensemble import IsolationForest
+from anomalyLabels import anomaly_labels
+from edgeExport import teacher_labels
+
+
+MODEL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# The shipped classifier predicts 1 for anomalies, single readings included
+def test_classifier_labels():
+
+    model = load(os.path.join(MODEL_DIR, 'randomForest_Model.joblib'))
+    scaler = load(os.path.join(MODEL_DIR, 'randomForest_Scaler.joblib'))
+
+    assert list(teacher_labels(model, scaler, np.array([[55.0, 12.0, 900.0]]))) == [1]
+    assert list(teacher_labels(model, scaler, np.array([[24.0, 50.0, 60.0]]))) == [0]
+
+
+# Isolation Forest predicts -1 for anomalies and 1 for normal readings
+def test_isolation_forest_labels():
+
+    model = IsolationForest(random_state=0).fit(np.random.default_rng(0).normal(size=(200, 3)))
+
+    # A batch of normal readings only, where 1 must not be read as an anomaly
+    assert list(anomaly_labels(model, np.array([1, 1]))) == [0, 0]
+    assert list(anomaly_labels(model, np.array([-1, 1]))) == [1, 0]
@@ -0,0 +1,34 @@
+# Importing the required libraries
+import json
+from loadBenchmark import compare
+
+
+# Function to write a results file with one route entry
+def results(tmp_path, name, throughput, p99, errorRate):
+
+    path = tmp_path / name
+
+    path.write_text(json.dumps({"routes": {"index@1": {
+
+        "throughput_per_s": throughput,
+        "latency_ms": {"p99": p99},
+        "error_rate": errorRate
+    }}}))
+
+    return str(path)
+
+
+def test_no_change(tmp_path):
+
+    assert compare(results(tmp_path, 'old.json', 100.0, 10.0, 0.0), results(tmp_path, 'new.json', 101.0, 10.5, 0.0)) == 0
+
+
+# Errors appearing where there were none are a regression
+def test_error_rate_from_zero(tmp_path):
+
+    assert compare(results(tmp_path, 'old.json', 100.0, 10.0, 0.0), results(tmp_path, 'new.json', 100.0, 10.0, 0.02)) == 1
+
+
+def test_latency_and_throughput(tmp_path):
+
+    assert compare(results(tmp_path, 'old.json', 100.0, 10.0, 0.01), results(tmp_path, 'new.json', 50.0, 20.0, 0.01)) == 2
@@ -0,0 +1,96 @@
+# Importing the required libraries
+import numpy as np
+from outOfCoreTraining import DuplicateFilter, StratifiedReservoir
+
+
+# Function to make distinct 64-bit row hashes, high bits included
+def row_hashes(count, seed=0):
+
+    return np.unique(np.random.default_rng(seed).integers(0, 2 ** 64, count, dtype=np.uint64, endpoint=False))
+
+
+# Each hash sets exactly its k bits: (low + i * high) mod m, high forced odd
+def test_bit_positions():
+
+    duplicateFilter = DuplicateFilter(sizeMb=1, hashes=4)
+
+    rowHash = np.uint64(0xFEDCBA9876543210)
+
+    duplicateFilter.unique(np.array([rowHash]))
+
+    low, high = 0x76543210, 0xFEDCBA98 | 1
+
+    expected = {(low + i * high) % duplicateFilter.bitCount for i in range(4)}
+
+    setBits = set(np.flatnonzero(np.unpackbits(duplicateFilter.bits, bitorder='little')).tolist())
+
+    assert setBits == expected
+
+
+# Rows seen in an earlier chunk are dropped, new rows are kept
+def test_duplicates_across_chunks():
+
+    duplicateFilter = DuplicateFilter(sizeMb=1)
+
+    hashes = row_hashes(20000)
+
+    first, second = hashes[:10000], hashes[10000:]
+
+    assert duplicateFilter.unique(first).all()
+
+    keep = duplicateFilter.unique(np.concatenate([second, first[:5000]]))
+
+    assert keep[:len(second)].all()
+    assert not keep[len(second):].any()
+
+
+# Within one chunk only the first copy of a row is kept
+def test_duplicates_inside_a_chunk():
+
+    duplicateFilter = DuplicateFilter(sizeMb=1)
+
+    hashes = np.array([5, 7, 5, 9, 7, 5], dtype=np.uint64)
+
+    assert duplicateFilter.unique(hashes).tolist() == [True, True, False, True, False, False]
+
+
+# Each class keeps at most `capacity` rows, a smaller class keeps all of its rows
+def test_reservoir_caps_each_class():
+
+    reservoir = StratifiedReservoir(capacity=100)
+
+    for chunk in range(20):
+
+        y = np.array([0] * 95 + [1] * 5, dtype=np.int16)
+
+        # Features encode the label, to check rows stay paired with it
+        X = np.column_stack([y, np.full(100, chunk), np.arange(100)]).astype(np.float32)
+
+        reservoir.add(X, y)
+
+    X, y = reservoir.arrays()
+
+    assert (y == 0).sum() == 100
+    assert (y == 1).sum() == 100
+    assert (X[:, 0] == y).all()
+    assert y.dtype == np.int16
+
+    # Rows are kept once, never duplicated by the merges
+    assert len(np.unique(X, axis=0)) == len(X)
+
+
+# The sample is uniform over the stream, not biased toward early or late chunks
+def test_reservoir_is_uniform():
+
+    reservoir = StratifiedReservoir(capacity=2000, seed=1)
+
+    for chunk in range(10):
+
+        reservoir.add(np.full((2000, 1), chunk, dtype=np.float32), np.zeros(2000, dtype=np.int16))
+
+    X, y = reservoir.arrays()
+
+    counts = np.bincount(X[:, 0].astype(int), minlength=10)
+
+    # 200 expected per chunk, binomial standard deviation about 13
+    assert counts.min() > 140 and counts.max() < 260
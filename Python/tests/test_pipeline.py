@@ -0,0 +1,127 @@
+# Importing the required libraries
+import pytest
+import threading
+import serialParser as messages
+from serialParser import SerialMessageParser, DistanceSeries
+from commandChannel import CommandChannel
+from pipeline import RingBuffer, IngestStatus
+
+
+# Function to build a record with the given sequence number
+def record(sequence):
+
+    return (sequence, float(sequence), 20.0, 50.0, 60.0, 0, 0.0, 0.0)
+
+
+@pytest.fixture
+def ring():
+
+    ring = RingBuffer.create(4)
+
+    yield ring
+
+    ring.close()
+
+
+# Records come out in order across several laps of the ring
+def test_ring_wraparound(ring):
+
+    consumer = RingBuffer.attach(ring.name, 4)
+
+    received = []
+
+    for sequence in range(10):
+
+        assert ring.put(record(sequence))
+
+        if sequence % 3 == 2:
+
+            records = consumer.peek(4)
+
+            received += [r[0] for r in records]
+
+            consumer.commit(len(records))
+
+    received += [r[0] for r in consumer.peek(4)]
+
+    assert received == list(range(10))
+    assert ring.last()[0] == 9
+
+    consumer.close()
+
+
+# A full ring blocks the producer until the stop event is set
+def test_ring_full(ring):
+
+    for sequence in range(4):
+
+        ring.put(record(sequence))
+
+    stopEvent = threading.Event()
+
+    stopEvent.set()
+
+    assert not ring.put(record(4), stopEvent)
+
+    ring.commit(1)
+
+    assert ring.put(record(4))
+    assert [r[0] for r in ring.peek(4)] == [1, 2, 3, 4]
+
+
+# Peeking past records read earlier but not committed
+def test_ring_peek_skip(ring):
+
+    for sequence in range(4):
+
+        ring.put(record(sequence))
+
+    assert [r[0] for r in ring.peek(2, skip=1)] == [1, 2]
+    assert ring.peek(4, skip=4) == []
+    assert ring.peek(4, skip=6) == []
+
+    ring.commit(2)
+
+    assert [r[0] for r in ring.peek(4, skip=1)] == [3]
+
+
+class FakeSerial:
+
+    def write(self, data):
+
+        return len(data)
+
+
+# The storage process serves the ingest process's parser and distance state
+def test_ingest_status_round_trip(tmp_path):
+
+    parser = SerialMessageParser()
+
+    distanceSeries = DistanceSeries(str(tmp_path / 'distance.csv'))
+
+    commandChannel = CommandChannel(FakeSerial())
+
+    parser.on(messages.DISTANCE, distanceSeries.record)
+    parser.on(messages.SPEED_REJECTED, lambda reason: commandChannel.reject('speed', reason))
+
+    commandChannel.send("speed999")
+    commandChannel.send("rate2000")
+
+    for line in ["Distance: 12", "Distance: 15", "Invalid speed! Must be between 0 and 255."]:
+
+        parser.dispatch(line)
+
+    status = IngestStatus(str(tmp_path / 'status.json'))
+
+    # Nothing published yet
+    assert status.latest() == [] and status.report()["total"] == 0
+
+    status.write(parser, commandChannel, distanceSeries)
+
+    distanceSeries.close()
+
+    assert status.latest(1) == distanceSeries.latest(1)
+    assert [distance for _, distance in status.latest()] == [12, 15]
+    assert status.report()["total"] == 3
+    assert list(status.unacknowledged()) == ['rate']
+    assert status.rejected['speed']['value'] == '999'
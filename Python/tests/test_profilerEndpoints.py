@@ -0,0 +1,68 @@
+# Importing the required libraries
+import pytest
+import tracemalloc
+from flask import Flask
+from profilerEndpoints import profiler, sampler
+
+
+@pytest.fixture
+def client():
+
+    app = Flask(__name__)
+
+    app.register_blueprint(profiler)
+
+    yield app.test_client()
+
+    sampler.stop()
+
+    tracemalloc.stop()
+
+
+# Bad query parameters are client errors, not server errors
+@pytest.mark.parametrize("method, url", [
+
+    ('post', '/admin/profile/start?seconds=abc'),
+    ('post', '/admin/profile/start?seconds=-5'),
+    ('post', '/admin/profile/start?interval=nan'),
+    ('post', '/admin/memory/start?frames=ten'),
+    ('post', '/admin/memory/start?frames=0'),
+    ('get', '/admin/memory/top?limit=1.5'),
+    ('get', '/admin/memory/top?group=module')
+])
+def test_invalid_parameters_return_400(client, method, url):
+
+    # /memory/top checks its parameters once tracing runs
+    client.post('/admin/memory/start')
+
+    response = getattr(client, method)(url)
+
+    assert response.status_code == 400
+    assert 'message' in response.get_json()
+
+
+def test_valid_parameters(client):
+
+    response = client.post('/admin/profile/start?seconds=0.1&interval=0.01')
+
+    assert response.status_code == 200
+    assert response.get_json()["seconds"] == 0.1
+
+    assert client.post('/admin/memory/start?frames=2').status_code == 200
+    assert client.get('/admin/memory/top?limit=3&group=filename').status_code == 200
+
+
+# An interval longer than the profile (inf included) still ends on time
+@pytest.mark.parametrize("interval", ["inf", "5"])
+def test_interval_is_bounded_by_seconds(client, interval):
+
+    response = client.post(f'/admin/profile/start?seconds=0.2&interval={interval}')
+
+    assert response.status_code == 200
+    assert response.get_json()["interval"] == 0.2
+
+    sampler.thread.join(timeout=2)
+
+    assert not sampler.running()
+    assert sampler.stoppedAt is not None
+    assert sampler.stoppedAt - sampler.startedAt < 1.0
@@ -0,0 +1,84 @@
+# Importing the required libraries
+import re
+import pytest
+import serialParser as messages
+from serialParser import SerialMessageParser, DistanceSeries
+
+
+# Every line the firmware prints, with the type and payload it must parse to
+@pytest.mark.parametrize("line, messageType, payload", [
+
+    ('{"Temperature": 24.0, "Humidity": 51.0, "Gas": 63}', messages.TELEMETRY, {"Temperature": 24.0, "Humidity": 51.0, "Gas": 63}),
+    ('{"Temperature": 24.0,', messages.MALFORMED, '{"Temperature": 24.0,'),
+    ("Distance: 37", messages.DISTANCE, "37"),
+    ("Obstacle detected!", messages.OBSTACLE, ""),
+    ("Ultrasonic Sensor Timeout", messages.SENSOR_TIMEOUT, ""),
+    ("Command received: f", messages.COMMAND_ACK, "f"),
+    ("Speed set to: 150", messages.SPEED_ACK, "150"),
+    ("Rate set to: 2000", messages.RATE_ACK, "2000"),
+    ("Mode changed to: autonomous", messages.MODE_ACK, "autonomous"),
+    ("Edge anomaly detected!", messages.EDGE_ALERT, ""),
+    ("Invalid command! Try again.", messages.COMMAND_REJECTED, "Try again."),
+    ("Invalid speed! Must be between 0 and 255.", messages.SPEED_REJECTED, "Must be between 0 and 255."),
+    ("Invalid rate! Must be between 1000 and 60000.", messages.RATE_REJECTED, "Must be between 1000 and 60000."),
+    ("Invalid input", messages.INFO, "input"),
+    ("Bluetooth connection Ready!", messages.INFO, ""),
+    ("something else", messages.UNKNOWN, "something else")
+])
+def test_parse(line, messageType, payload):
+
+    assert SerialMessageParser().parse(line) == (messageType, payload)
+
+
+def test_dispatch_routes_and_counts():
+
+    received = []
+
+    parser = SerialMessageParser().on(messages.DISTANCE, received.append)
+
+    for line in ["Distance: 10", "Distance: 12", "Obstacle detected!", "noise"]:
+
+        parser.dispatch(line)
+
+    assert received == ["10", "12"]
+
+    report = parser.report()
+
+    assert report["total"] == 4
+    assert report["types"][messages.DISTANCE]["count"] == 2
+
+
+# Recent readings use the same timestamp format as the CSV files
+def test_distance_series_timestamps(tmp_path):
+
+    series = DistanceSeries(str(tmp_path / 'distance.csv'))
+
+    series.record("25", timeStamp=1735689600.0)
+    series.record("not a number")
+
+    series.close()
+
+    (timeStamp, distance), = series.latest()
+
+    assert distance == 25
+    assert re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d", timeStamp)
+
+    lines = (tmp_path / 'distance.csv').read_text().splitlines()
+
+    assert lines == ["Timestamp,Distance", f"{timeStamp},25"]
+
+
+# A zero or negative count returns nothing, not the whole buffer or a tail
+def test_distance_series_latest_count(tmp_path):
+
+    series = DistanceSeries(str(tmp_path / 'distance.csv'))
+
+    for distance in range(5):
+
+        series.record(str(distance))
+
+    series.close()
+
+    assert [distance for _, distance in series.latest(2)] == [3, 4]
+    assert series.latest(0) == []
+    assert series.latest(-3) == []
@@ -0,0 +1,49 @@
+# Importing the required libraries
+import pytest
+from syntheticTelemetry import Settings, generate, min_chunk_rows
+
+
+# Longest episode: 1200 s active plus 5 decay time constants of 300 s
+def test_min_chunk_rows():
+
+    assert min_chunk_rows(2.0) == 1350
+
+    with pytest.raises(ValueError):
+
+        Settings(10000, chunkRows=min_chunk_rows(2.0) - 1)
+
+
+# The output is byte-identical whatever the worker count, and fixed by the seed
+@pytest.mark.parametrize("extension", [".csv", ".bin"])
+def test_output_does_not_depend_on_workers(tmp_path, extension):
+
+    # Two full chunks and a partial one, with frequent episodes
+    settings = Settings(2 * min_chunk_rows() + 500, seed=7, chunkRows=min_chunk_rows(), episodesPerDay=50.0)
+
+    paths = [str(tmp_path / f"{name}{extension}") for name in ("single", "pool", "again")]
+
+    generate(paths[0], settings, workers=1)
+    generate(paths[1], settings, workers=2)
+    generate(paths[2], settings, workers=1)
+
+    single, pool, again = [open(path, 'rb').read() for path in paths]
+
+    assert single == pool == again
+
+    other = str(tmp_path / f"other{extension}")
+
+    generate(other, Settings(settings.rows, seed=8, chunkRows=settings.chunkRows, episodesPerDay=50.0), workers=1)
+
+    assert open(other, 'rb').read() != single
+
+
+def test_csv_rows_and_header(tmp_path):
+
+    path = str(tmp_path / "data.csv")
+
+    generate(path, Settings(2 * min_chunk_rows() + 500, chunkRows=min_chunk_rows()), workers=1)
+
+    lines = open(path).read().splitlines()
+
+    assert lines[0] == "Timestamp,Temperature,Humidity,Gas,Anomaly"
+    assert len(lines) == 1 + 2 * min_chunk_rows() + 500
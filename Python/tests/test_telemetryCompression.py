@@ -0,0 +1,146 @@
+# Importing the required libraries
+import numpy as np
+import pandas as pd
+import pytest
+from telemetryCompression import CHANNELS, DEADBAND, SWINGING_DOOR, TelemetryCompressor, reconstruct_series
+
+
+# Function to compress a series and return the stored rows
+def compress(timeStamps, series, anomalies, method, maxError, maxInterval=60.0):
+
+    compressor = TelemetryCompressor(method=method, maxError=maxError, maxInterval=maxInterval)
+
+    stored = []
+
+    for index, timeStamp in enumerate(timeStamps):
+
+        stored += compressor.offer(timeStamp, {channel: series[channel][index] for channel in CHANNELS}, anomalies[index])
+
+    return stored + compressor.flush()
+
+
+# Function to rebuild the readings at the original timestamps from the stored rows
+def reconstruct(stored, method):
+
+    dataset = pd.DataFrame({
+
+        "Timestamp": pd.to_datetime([row[0] for row in stored], unit='s'),
+        **{channel: [row[1][channel] for row in stored] for channel in CHANNELS},
+        "Anomaly": [row[2] for row in stored]
+    })
+
+    return reconstruct_series(dataset, freq='2s', method=method)
+
+
+# Reconstruction error stays within maxError on random walks, with anomalies and heartbeats
+@pytest.mark.parametrize("method", [SWINGING_DOOR, DEADBAND])
+@pytest.mark.parametrize("seed", range(5))
+def test_reconstruction_error_is_bounded(method, seed):
+
+    generator = np.random.default_rng(seed)
+
+    rows = 5000
+
+    maxError = {"Temperature": 0.5, "Humidity": 1.0, "Gas": 5.0}
+
+    timeStamps = 1.7e9 + 2.0 * np.arange(rows)
+
+    series = {channel: np.cumsum(generator.normal(0, maxError[channel], rows)) for channel in CHANNELS}
+
+    anomalies = (generator.random(rows) < 0.002).astype(int)
+
+    stored = compress(timeStamps, series, anomalies, method, maxError)
+
+    assert len(stored) < rows
+
+    series = pd.DataFrame(series)
+
+    rebuilt = reconstruct(stored, method)
+
+    # Swinging door stores the last reading on flush, deadband holds the last stored one
+    covered = len(rebuilt)
+
+    if method == SWINGING_DOOR:
+
+        assert covered == rows
+
+    for channel in CHANNELS:
+
+        error = np.abs(rebuilt[channel].to_numpy() - series[channel].to_numpy()[:covered]).max()
+
+        assert error <= maxError[channel] + 1e-9
+
+    # Every anomalous reading is stored as is
+    storedTimes = {row[0] for row in stored}
+
+    assert all(timeStamp in storedTimes for timeStamp in timeStamps[anomalies == 1])
+
+
+# A point that fits the door but not the line to it must not end the segment
+def test_swinging_door_checks_earlier_points():
+
+    values = [0.0, 1.0, -0.9, 10.0]
+
+    series = {channel: values for channel in CHANNELS}
+
+    stored = compress([0.0, 1.0, 2.0, 3.0], series, [0] * 4, SWINGING_DOOR, {channel: 1.0 for channel in CHANNELS})
+
+    times = [row[0] for row in stored]
+
+    reconstructed = np.interp([0.0, 1.0, 2.0, 3.0], times, [row[1]["Gas"] for row in stored])
+
+    assert np.abs(reconstructed - values).max() <= 1.0
+
+
+# Readings inside the error band are not stored
+def test_flat_signal_is_compressed():
+
+    rows = 20
+
+    series = {channel: [20.0] * rows for channel in CHANNELS}
+
+    stored = compress(2.0 * np.arange(rows), series, [0] * rows, SWINGING_DOOR, None)
+
+    assert [row[0] for row in stored] == [0.0, 38.0]
+
+
+# Rows from oldest_unstored() on exist only in memory until stored or covered
+def test_oldest_unstored():
+
+    compressor = TelemetryCompressor(method=SWINGING_DOOR)
+
+    reading = {channel: 20.0 for channel in CHANNELS}
+
+    compressor.offer(0.0, reading, 0)
+
+    assert compressor.oldest_unstored() is None
+
+    compressor.offer(2.0, reading, 0)
+    compressor.offer(4.0, reading, 0)
+
+    assert compressor.oldest_unstored() == 2.0
+
+    compressor.flush()
+
+    assert compressor.oldest_unstored() is None
+
+
+# Gaps longer than maxGap are not filled in, each side is resampled on its own
+def test_reconstruction_does_not_fill_gaps():
+
+    timeStamps = ["2025-01-01 00:00:00", "2025-01-01 00:00:10", "2025-03-01 00:00:01", "2025-03-01 00:00:05"]
+
+    dataset = pd.DataFrame({
+
+        "Timestamp": timeStamps,
+        **{channel: [0.0, 10.0, 50.0, 54.0] for channel in CHANNELS},
+        "Anomaly": [0, 0, 1, 1]
+    })
+
+    rebuilt = reconstruct_series(dataset, freq='2s', maxGap=60.0)
+
+    assert len(rebuilt) == 6 + 3
+
+    assert rebuilt["Timestamp"].iloc[6] == pd.Timestamp("2025-03-01 00:00:01")
+    assert rebuilt["Gas"].tolist() == [0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 50.0, 52.0, 54.0]
+    assert rebuilt["Anomaly"].tolist() == [0] * 6 + [1] * 3
@@ -0,0 +1,82 @@
+# Importing the required libraries
+import pytest
+from telemetryRate import TelemetryRateController
+
+
+# Command channel stand-in recording the commands sent
+class FakeChannel:
+
+    def __init__(self):
+
+        self.sent = []
+
+    def send(self, command):
+
+        self.sent.append(command)
+
+
+@pytest.fixture
+def controller():
+
+    return TelemetryRateController(FakeChannel(), probThreshold=0.5, gasThreshold=300.0)
+
+
+# A higher risk switches to a faster rate on the same reading
+def test_speeds_up_immediately(controller):
+
+    assert controller.update(0.0, 50.0, now=0.0) == 10000
+
+    assert controller.update(0.9, 50.0, now=1.0) == 1000
+
+    assert controller.commandChannel.sent == ["rate10000", "rate1000"]
+
+
+# A lower risk only slows the rate down after holdSeconds of calm readings
+def test_holds_before_slowing_down(controller):
+
+    controller.update(0.9, 50.0, now=0.0)
+
+    assert controller.update(0.0, 50.0, now=30.0) == 1000
+    assert controller.update(0.0, 50.0, now=59.9) == 1000
+
+    # A risky reading restarts the hold
+    controller.update(0.9, 50.0, now=60.0)
+
+    assert controller.update(0.0, 50.0, now=119.9) == 1000
+    assert controller.update(0.0, 50.0, now=120.0) == 10000
+
+    assert controller.commandChannel.sent == ["rate1000", "rate10000"]
+
+
+# Gas rising 10 units/s reaches the threshold within the 30 s horizon
+def test_rising_gas_is_projected(controller):
+
+    for second in range(5):
+
+        rate = controller.update(0.0, 100.0 + 10.0 * second, now=float(second))
+
+    assert controller.gas_trend() == pytest.approx(10.0)
+
+    # 140 + 10 * 30 = 440, above the 300 threshold
+    assert controller.risk(0.0, 140.0) == pytest.approx(440.0 / 300.0)
+    assert rate == 1000
+
+
+# Falling gas is not projected, only its current level counts
+def test_falling_gas_is_not_projected(controller):
+
+    for second in range(5):
+
+        controller.update(0.0, 140.0 - 10.0 * second, now=float(second))
+
+    assert controller.gas_trend() == pytest.approx(-10.0)
+    assert controller.risk(0.0, 100.0) == pytest.approx(100.0 / 300.0)
+
+
+# Rates stay within the firmware limits whatever the levels say
+def test_rate_is_clamped_to_firmware_limits():
+
+    controller = TelemetryRateController(FakeChannel(), levels=[(0.0, 120000), (1.0, 200)])
+
+    assert controller.rate_for(0.0) == 60000
+    assert controller.rate_for(5.0) == 1000